@@ -27,10 +27,18 @@ import logging
 from logging import NullHandler
 from typing import TextIO
 
+from .cache import *
+from .checkpoint import *
+from .concurrency import *
 from .data import *
+from .decoders import *
+from .hedge import *
 from .legacy.core import Kit, async_pnwkit, pnwkit  # type: ignore
 from .legacy.keys import set_bot_key, set_key  # type: ignore
 from .new import *
+from .persisted import *
+from .ratelimit import *
+from .retry import *
 
 __version__ = "2.6.26"
 
@@ -27,10 +27,18 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, overload, TextIO
 import logging
 
+from .cache import *
+from .checkpoint import *
+from .concurrency import *
 from .data import *
+from .decoders import *
+from .hedge import *
 from .legacy.core import Kit, async_pnwkit, pnwkit  # type: ignore
 from .legacy.keys import set_bot_key, set_key
 from .new import *
+from .persisted import *
+from .ratelimit import *
+from .retry import *
 
 __all__ = (
     "set_key",
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import collections
+import threading
+import time
+from typing import TYPE_CHECKING
+
+__all__ = ("ResultCache",)
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+
+class CacheEntry:
+    __slots__ = ("value", "expires", "size")
+
+    def __init__(self, value: Any, expires: float, size: int) -> None:
+        self.value: Any = value
+        self.expires: float = expires
+        self.size: int = size
+
+
+class ResultCache:
+    def __init__(
+        self,
+        ttl: float = 60,
+        ttls: Optional[Dict[str, float]] = None,
+        *,
+        max_entries: Optional[int] = 1024,
+        max_bytes: Optional[int] = None,
+        stale_while_revalidate: float = 0,
+    ) -> None:
+        """An in-memory cache of query results with per field expiry and least recently used eviction
+
+        Parameters
+        ----------
+        ttl : float, optional
+            The number of seconds to keep results for, by default 60
+        ttls : Optional[Dict[str, float]], optional
+            The number of seconds to keep results for by root field name, overriding ``ttl``, by default None
+        max_entries : Optional[int], optional
+            The maximum number of results to keep, by default 1024
+        max_bytes : Optional[int], optional
+            The maximum approximate size of the results to keep, measured by the length of the responses they were parsed from, by default None
+        stale_while_revalidate : float, optional
+            The number of seconds after a result expires that it will still be returned to asynchronous queries while it is refreshed in the background, by default 0
+        """
+        self.ttl: float = ttl
+        self.ttls: Dict[str, float] = ttls or {}
+        self.max_entries: Optional[int] = max_entries
+        self.max_bytes: Optional[int] = max_bytes
+        self.stale_while_revalidate: float = stale_while_revalidate
+        self.entries: collections.OrderedDict[
+            Hashable, CacheEntry
+        ] = collections.OrderedDict()
+        self.size: int = 0
+        self.lock: threading.Lock = threading.Lock()
+        self.refreshing: Dict[Hashable, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def ttl_for(self, fields: Iterable[str]) -> float:
+        """Get the number of seconds to keep a result for
+
+        Parameters
+        ----------
+        fields : Iterable[str]
+            The names of the root fields in the query
+
+        Returns
+        -------
+        float
+            The shortest expiry of any of the fields
+        """
+        return min((self.ttls.get(i, self.ttl) for i in fields), default=self.ttl)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        value, stale = self.lookup(key)
+        return None if stale else value
+
+    def lookup(self, key: Hashable) -> Tuple[Optional[Any], bool]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None, False
+            now = time.monotonic()
+            if entry.expires + self.stale_while_revalidate <= now:
+                self.remove(key)
+                return None, False
+            self.entries.move_to_end(key)
+            return entry.value, entry.expires <= now
+
+    def set(self, key: Hashable, value: Any, ttl: float, size: int = 0) -> None:
+        if ttl <= 0:
+            return
+        with self.lock:
+            if key in self.entries:
+                self.remove(key)
+            self.entries[key] = CacheEntry(value, time.monotonic() + ttl, size)
+            self.size += size
+            self.evict()
+
+    def remove(self, key: Hashable) -> None:
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry.size
+
+    def evict(self) -> None:
+        while self.entries and (
+            (self.max_entries is not None and len(self.entries) > self.max_entries)
+            or (self.max_bytes is not None and self.size > self.max_bytes)
+        ):
+            _, entry = self.entries.popitem(last=False)
+            self.size -= entry.size
+
+    def clear(self) -> None:
+        """Remove every result from the cache"""
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from abc import ABCMeta, abstractmethod
+from typing import TYPE_CHECKING
+
+__all__ = (
+    "PaginatorCheckpoint",
+    "CheckpointSink",
+    "FileCheckpointSink",
+)
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, Optional
+
+
+class PaginatorCheckpoint:
+    def __init__(
+        self,
+        page: int,
+        hash: str,
+        paginator_info: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """The position of a :class:`Paginator`, used to resume a crawl from the page after the last one it finished
+
+        Parameters
+        ----------
+        page : int
+            The last page whose items have all been yielded
+        hash : str
+            The sha256 hash of the paginator's query and its variables other than the page, so a checkpoint can't resume a different crawl
+        paginator_info : Optional[Dict[str, Any]], optional
+            The last paginator info received, by default None
+        """
+        self.page: int = page
+        self.hash: str = hash
+        self.paginator_info: Optional[Dict[str, Any]] = paginator_info
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} page={self.page} hash={self.hash}>"
+
+    @property
+    def finished(self) -> bool:
+        """Whether every page had been yielded"""
+        return (
+            self.paginator_info is not None
+            and not self.paginator_info.get("hasMorePages", True)
+            and self.page >= self.paginator_info.get("lastPage", self.page)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get a JSON serializable dictionary representation of this checkpoint.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary of the checkpoint.
+        """
+        return {
+            "page": self.page,
+            "hash": self.hash,
+            "paginator_info": self.paginator_info,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> PaginatorCheckpoint:
+        """Rebuild a checkpoint from :meth:`to_dict`
+
+        Parameters
+        ----------
+        data : Dict[str, Any]
+            The dictionary of the checkpoint
+
+        Returns
+        -------
+        PaginatorCheckpoint
+            The checkpoint
+        """
+        return cls(data["page"], data["hash"], data.get("paginator_info"))
+
+
+class CheckpointSink(metaclass=ABCMeta):
+    """The interface for storing the checkpoints a :class:`Paginator` saves as it is iterated"""
+
+    @abstractmethod
+    def save(self, checkpoint: PaginatorCheckpoint) -> None:
+        """Store a checkpoint, replacing any stored before
+
+        Parameters
+        ----------
+        checkpoint : PaginatorCheckpoint
+            The checkpoint to store
+        """
+        ...
+
+    @abstractmethod
+    def load(self) -> Optional[PaginatorCheckpoint]:
+        """Get the stored checkpoint
+
+        Returns
+        -------
+        Optional[PaginatorCheckpoint]
+            The checkpoint, or None if none has been stored
+        """
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove the stored checkpoint"""
+        ...
+
+
+class FileCheckpointSink(CheckpointSink):
+    def __init__(self, path: str) -> None:
+        """Stores checkpoints in a JSON file, replaced atomically so a crash while saving leaves the previous checkpoint intact
+
+        Parameters
+        ----------
+        path : str
+            The path of the file
+        """
+        self.path: str = path
+
+    def save(self, checkpoint: PaginatorCheckpoint) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp = tempfile.mkstemp(prefix=".checkpoint-", dir=directory)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(checkpoint.to_dict(), f)
+            os.replace(temp, self.path)
+        except BaseException:
+            os.unlink(temp)
+            raise
+
+    def load(self) -> Optional[PaginatorCheckpoint]:
+        try:
+            with open(self.path) as f:
+                return PaginatorCheckpoint.from_dict(json.load(f))
+        except FileNotFoundError:
+            return None
+
+    def clear(self) -> None:
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
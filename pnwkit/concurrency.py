@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+import statistics
+import time
+from typing import TYPE_CHECKING
+
+from .ratelimit import Priority
+
+__all__ = ("AdaptiveConcurrency",)
+
+if TYPE_CHECKING:
+    from typing import Deque, Optional
+
+    from .ratelimit import RateLimit
+
+
+class AdaptiveConcurrency:
+    def __init__(
+        self,
+        initial: int = 2,
+        *,
+        minimum: int = 1,
+        maximum: int = 16,
+        increase: float = 1,
+        backoff: float = 0.5,
+        tolerance: float = 1.5,
+        window: int = 20,
+        min_samples: int = 5,
+    ) -> None:
+        """Adjusts how many pages are fetched at once, growing additively while page latency stays flat and the rate limit has room, and shrinking multiplicatively on 429 responses, slow pages, failures, or daily budget pacing
+
+        Parameters
+        ----------
+        initial : int, optional
+            The number of pages to fetch at once to begin with, by default 2
+        minimum : int, optional
+            The fewest pages to fetch at once, by default 1
+        maximum : int, optional
+            The most pages to fetch at once, by default 16
+        increase : float, optional
+            The number of pages to add each time every page in flight completes without congestion, by default 1
+        backoff : float, optional
+            The factor to multiply the number of pages by on congestion, by default 0.5
+        tolerance : float, optional
+            How many times slower than the median of recent pages a page has to be to count as congestion, by default 1.5
+        window : int, optional
+            The number of recent page latencies to keep, by default 20
+        min_samples : int, optional
+            The number of page latencies needed before slow pages count as congestion, by default 5
+        """
+        self.limit: float = initial
+        self.minimum: int = minimum
+        self.maximum: int = maximum
+        self.increase: float = increase
+        self.backoff: float = backoff
+        self.tolerance: float = tolerance
+        self.min_samples: int = min_samples
+        self.latencies: Deque[float] = collections.deque(maxlen=window)
+        self.in_flight: int = 0
+        self.throttled: Optional[int] = None
+        self.shrunk_at: float = 0
+        self.changed: Optional[asyncio.Event] = None
+
+    @property
+    def size(self) -> int:
+        """The number of pages to fetch at once"""
+        return max(min(int(self.limit), self.maximum), self.minimum)
+
+    async def acquire(self) -> None:
+        """Wait until another page can be fetched"""
+        if self.changed is None:
+            self.changed = asyncio.Event()
+        while self.in_flight >= self.size:
+            self.changed.clear()
+            await self.changed.wait()
+        self.in_flight += 1
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self.notify()
+
+    def notify(self) -> None:
+        if self.changed is not None:
+            self.changed.set()
+
+    def record(
+        self,
+        started: float,
+        latency: float,
+        rate_limit: RateLimit,
+        priority: int = Priority.BACKGROUND,
+        throttled: int = 0,
+    ) -> None:
+        """Adjust the number of pages to fetch at once after a page is fetched
+
+        Parameters
+        ----------
+        started : float
+            The monotonic time the page was requested at
+        latency : float
+            The number of seconds the page took, including waiting on the rate limit
+        rate_limit : RateLimit
+            The rate limit the page was requested under
+        priority : int, optional
+            The :class:`Priority` of the page's request, by default Priority.BACKGROUND
+        throttled : int, optional
+            The total number of 429 responses received so far, by default 0
+        """
+        congested = (
+            (self.throttled is not None and throttled > self.throttled)
+            or (
+                len(self.latencies) >= self.min_samples
+                and latency > statistics.median(self.latencies) * self.tolerance
+            )
+            or (rate_limit.budget is not None and rate_limit.budget.pace(priority) > 0)
+        )
+        self.throttled = throttled
+        self.latencies.append(latency)
+        if congested:
+            self.shrink(started)
+        elif rate_limit.wait_time(priority) <= 0:
+            # one more page for each full round of pages without congestion
+            self.limit = min(self.limit + self.increase / self.limit, self.maximum)
+            self.notify()
+
+    def shrink(self, started: float) -> None:
+        if started < self.shrunk_at:
+            # the page was requested before the last shrink, so it was already accounted for
+            return
+        self.limit = max(self.limit * self.backoff, self.minimum)
+        self.shrunk_at = time.monotonic()
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json
+from abc import ABCMeta, abstractmethod
+from typing import TYPE_CHECKING
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+__all__ = (
+    "Decoder",
+    "IncrementalDecoder",
+    "StdlibDecoder",
+    "OrjsonDecoder",
+    "MsgspecDecoder",
+    "default_decoder",
+)
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Optional, Tuple, Union
+
+
+class Decoder(metaclass=ABCMeta):
+    """The interface for decoding JSON responses and socket frames, decoders raise :class:`json.JSONDecodeError` for invalid JSON"""
+
+    @abstractmethod
+    def loads(self, text: Union[str, bytes]) -> Any:
+        """Decode a JSON document
+
+        Parameters
+        ----------
+        text : Union[str, bytes]
+            The document to decode
+
+        Returns
+        -------
+        Any
+            The decoded value
+        """
+        ...
+
+
+class IncrementalDecoder(Decoder):
+    """The interface for decoders that can decode one value at a time, letting paginated results be decoded one item at a time"""
+
+    @abstractmethod
+    def raw_decode(self, text: str, index: int) -> Tuple[Any, int]:
+        """Decode a single JSON value starting at an index
+
+        Parameters
+        ----------
+        text : str
+            The document containing the value
+        index : int
+            The index the value starts at
+
+        Returns
+        -------
+        Tuple[Any, int]
+            The decoded value and the index after it
+        """
+        ...
+
+
+class StdlibDecoder(IncrementalDecoder):
+    def __init__(
+        self,
+        parse_int: Optional[Callable[[str], Any]] = None,
+        parse_float: Optional[Callable[[str], Any]] = None,
+    ) -> None:
+        """Decodes JSON with the standard library, supporting custom parsing of numbers and decoding paginated results one item at a time
+
+        Parameters
+        ----------
+        parse_int : Optional[Callable[[str], Any]], optional
+            A function to use when parsing ints, by default None
+        parse_float : Optional[Callable[[str], Any]], optional
+            A function to use when parsing floats, by default None
+        """
+        self.decoder: json.JSONDecoder = json.JSONDecoder(
+            parse_int=parse_int, parse_float=parse_float
+        )
+
+    def loads(self, text: Union[str, bytes]) -> Any:
+        if isinstance(text, bytes):
+            text = text.decode("utf-8")
+        return self.decoder.decode(text)
+
+    def raw_decode(self, text: str, index: int) -> Tuple[Any, int]:
+        return self.decoder.raw_decode(text, index)
+
+
+class OrjsonDecoder(Decoder):
+    def __init__(self) -> None:
+        """Decodes JSON with orjson"""
+        if orjson is None:
+            raise RuntimeError("orjson is not installed")
+
+    def loads(self, text: Union[str, bytes]) -> Any:
+        # orjson's JSONDecodeError is a subclass of json.JSONDecodeError
+        return orjson.loads(text)  # type: ignore
+
+
+class MsgspecDecoder(Decoder):
+    def __init__(self) -> None:
+        """Decodes JSON with msgspec"""
+        if msgspec is None:
+            raise RuntimeError("msgspec is not installed")
+        self.decoder: Any = msgspec.json.Decoder()
+
+    def loads(self, text: Union[str, bytes]) -> Any:
+        try:
+            return self.decoder.decode(text)
+        except msgspec.DecodeError as e:  # type: ignore
+            if isinstance(text, bytes):
+                text = text.decode("utf-8", "replace")
+            raise json.JSONDecodeError(str(e), text, 0) from e
+
+
+def default_decoder(
+    parse_int: Optional[Callable[[str], Any]] = None,
+    parse_float: Optional[Callable[[str], Any]] = None,
+) -> Decoder:
+    """Get the fastest decoder available, orjson or msgspec are used when installed unless custom number parsing is needed, neither decodes paginated results one item at a time so pass a :class:`StdlibDecoder` to the QueryKit if memory matters more than speed
+
+    Parameters
+    ----------
+    parse_int : Optional[Callable[[str], Any]], optional
+        A function to use when parsing ints, by default None
+    parse_float : Optional[Callable[[str], Any]], optional
+        A function to use when parsing floats, by default None
+
+    Returns
+    -------
+    Decoder
+        The decoder to use
+    """
+    if parse_int is None and parse_float is None:
+        if orjson is not None:
+            return OrjsonDecoder()
+        if msgspec is not None:
+            return MsgspecDecoder()
+    return StdlibDecoder(parse_int, parse_float)
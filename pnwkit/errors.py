@@ -12,6 +12,9 @@ __all__ = (
     "PersistedQueryNotFound",
     "SubscribeError",
     "InvalidResponse",
+    "NoKeysAvailable",
+    "DeadlineExceeded",
+    "CheckpointMismatch",
 )
 
 
@@ -57,3 +60,15 @@ class SubscribeError(PnWKitException):
 
 class InvalidResponse(PnWKitException):
     ...
+
+
+class NoKeysAvailable(PnWKitException):
+    ...
+
+
+class DeadlineExceeded(PnWKitException):
+    ...
+
+
+class CheckpointMismatch(PnWKitException):
+    ...
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import collections
+import math
+import threading
+from typing import TYPE_CHECKING
+
+from .ratelimit import Priority
+
+__all__ = ("HedgePolicy",)
+
+if TYPE_CHECKING:
+    from typing import Deque, Optional
+
+    from .ratelimit import RateLimit
+
+
+class HedgePolicy:
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        *,
+        window: int = 200,
+        min_samples: int = 20,
+        min_delay: float = 0.05,
+        headroom: float = 0.5,
+    ) -> None:
+        """Decides when a duplicate request is sent for a query that is taking longer than usual, using whichever response arrives first
+
+        Parameters
+        ----------
+        percentile : float, optional
+            The percentile of recent response times a query has to exceed before it is hedged, by default 0.95
+        window : int, optional
+            The number of recent response times to keep, by default 200
+        min_samples : int, optional
+            The number of response times needed before any query is hedged, by default 20
+        min_delay : float, optional
+            The minimum number of seconds to wait before hedging a query, by default 0.05
+        headroom : float, optional
+            The share of the rate limit that has to be left in the current window to hedge a query, by default 0.5
+        """
+        self.percentile: float = percentile
+        self.min_samples: int = min_samples
+        self.min_delay: float = min_delay
+        self.headroom: float = headroom
+        self.latencies: Deque[float] = collections.deque(maxlen=window)
+        self.lock: threading.Lock = threading.Lock()
+        self.hedged: int = 0
+        self.won: int = 0
+
+    def record(self, latency: float) -> None:
+        with self.lock:
+            self.latencies.append(latency)
+
+    def delay(self) -> Optional[float]:
+        """Get the number of seconds to wait for a response before hedging
+
+        Returns
+        -------
+        Optional[float]
+            The number of seconds, or None if too few response times have been recorded
+        """
+        with self.lock:
+            if len(self.latencies) < self.min_samples:
+                return None
+            latencies = sorted(self.latencies)
+        index = min(math.ceil(self.percentile * len(latencies)), len(latencies)) - 1
+        return max(latencies[max(index, 0)], self.min_delay)
+
+    def can_hedge(self, rate_limit: RateLimit, priority: int) -> bool:
+        """Whether a rate limit has spare capacity for a hedged request
+
+        Parameters
+        ----------
+        rate_limit : RateLimit
+            The rate limit the hedged request would be sent under
+        priority : int
+            The :class:`Priority` of the query being hedged
+
+        Returns
+        -------
+        bool
+            Whether a hedged request can be sent without waiting or eating into the headroom
+        """
+        # this also refreshes shared rate limits from their database
+        if rate_limit.wait_time(priority) > 0:
+            return False
+        if rate_limit.limit is None or rate_limit.remaining is None:
+            return False
+        if (
+            rate_limit.budget is not None
+            and rate_limit.budget.pace(Priority.BACKGROUND) > 0
+        ):
+            # the daily budget has nothing to spare either
+            return False
+        return (
+            rate_limit.remaining - rate_limit.reserved(priority)
+            > rate_limit.limit * self.headroom
+        )
@@ -26,6 +26,7 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
+import collections
 import contextlib
 import datetime
 import enum
@@ -33,6 +34,7 @@ import hashlib
 import json
 import logging
 import time
+import weakref
 from typing import TYPE_CHECKING, Any, Generic, TypeVar, overload
 
 import aiohttp
@@ -41,18 +43,36 @@ import requests
 
 from . import data as data_classes
 from . import errors, utils
-from .ratelimit import RateLimit
+from .cache import ResultCache
+from .checkpoint import CheckpointSink, PaginatorCheckpoint
+from .concurrency import AdaptiveConcurrency
+from .decoders import Decoder, IncrementalDecoder, default_decoder
+from .hedge import HedgePolicy
+from .persisted import PersistedQueryRegistry
+from .ratelimit import (
+    RATE_LIMITS,
+    DailyBudget,
+    KeyPool,
+    PooledKey,
+    Priority,
+    RateLimit,
+    SharedRateLimit,
+)
+from .retry import RetryPolicy
 
 logger = logging.getLogger(__name__)
 
 __all__ = (
     "QueryKit",
     "Query",
+    "CompiledQuery",
     "Result",
     "Order",
     "OrderBy",
     "Field",
     "Paginator",
+    "ShardedPaginator",
+    "Loader",
     "Mutation",
     "Subscription",
     "VariableType",
@@ -62,12 +82,15 @@ __all__ = (
 if TYPE_CHECKING:
     from collections.abc import MutableMapping, MutableSequence, Sequence
     from typing import (
+        Awaitable,
         Callable,
         ClassVar,
         Coroutine,
+        Deque,
         Dict,
         Generator,
         Iterable,
+        Iterator,
         List,
         Literal,
         Optional,
@@ -173,6 +196,7 @@ if TYPE_CHECKING:
     SubscriptionFilters = Dict[str, Union[BaseArgument, Sequence[BaseArgument]]]
 
 P = TypeVar("P", bound="data_classes.Data")
+T_co = TypeVar("T_co")
 R = TypeVar("R", bound="Result")
 T = TypeVar("T", bound="data_classes.Data")
 
@@ -193,6 +217,18 @@ class QueryKit:
         socket: Optional[Socket] = None,
         aiohttp_session: Optional[aiohttp.ClientSession] = None,
         requests_session: Optional[requests.Session] = None,
+        batch_window: Optional[float] = None,
+        batch_max_fields: int = 10,
+        deduplicate: bool = False,
+        cache: Optional[ResultCache] = None,
+        shared_rate_limit: Optional[Union[str, Callable[[str, str], RateLimit]]] = None,
+        api_keys: Optional[Sequence[str]] = None,
+        daily_budget: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        timeout: Optional[float] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        decoder: Optional[Decoder] = None,
+        persisted_queries: Optional[PersistedQueryRegistry] = None,
     ) -> None:
         """Initialize a QueryKit
 
@@ -222,12 +258,37 @@ class QueryKit:
             The aiohttp session to use for queries, by default None
         requests_session : Optional[:class:`requests.Session`], optional
             The requests session to use for queries, by default None
+        batch_window : Optional[:class:`float`], optional
+            The number of seconds to wait for other queries to combine into a single request when awaiting queries asynchronously, by default None (no batching)
+        batch_max_fields : :class:`int`, optional
+            The maximum number of root fields to send in a single batched request, by default 10
+        deduplicate : :class:`bool`, optional
+            Whether identical queries awaited concurrently should share a single request and :class:`Result`, by default False
+        cache : Optional[:class:`ResultCache`], optional
+            The cache to store query results in, by default None (no caching)
+        shared_rate_limit : Optional[Union[:class:`str`, Callable[[:class:`str`, :class:`str`], :class:`RateLimit`]]], optional
+            The path of a SQLite database to keep rate limit state in, so processes on the same host using the same key share one rate limit, or a callable taking the URL and key and returning the :class:`RateLimit` to use for them, for state kept elsewhere, by default None (rate limits are kept per process)
+        api_keys : Optional[Sequence[:class:`str`]], optional
+            Additional API keys to spread queries across along with ``api_key``, mutations and subscriptions always use ``api_key``, by default None
+        daily_budget : :class:`bool`, optional
+            Whether to track each key's daily requests with a :class:`DailyBudget`, checking it against the API periodically and pacing background requests so the daily maximum lasts the day, by default False
+        retry_policy : Optional[:class:`RetryPolicy`], optional
+            The policy to retry requests that fail with connection errors, timeouts, or server errors by, by default None (only requests receiving a 429 are retried)
+        timeout : Optional[:class:`float`], optional
+            The default number of seconds each query has to complete in, including waiting on the rate limit and retries, by default None (no timeout)
+        hedge_policy : Optional[:class:`HedgePolicy`], optional
+            The policy to send a duplicate request by when an asynchronous query is slower than usual and the rate limit has capacity to spare, by default None (no hedging)
+        decoder : Optional[:class:`Decoder`], optional
+            The decoder to parse responses and socket frames with, ``parse_int`` and ``parse_float`` are ignored when set, by default orjson or msgspec if installed and neither ``parse_int`` nor ``parse_float`` is set, otherwise the standard library. Only an :class:`IncrementalDecoder` such as :class:`StdlibDecoder` decodes paginated results one item at a time, orjson and msgspec decode each page in one go, which is faster but holds every item of the page as dictionaries at once
+        persisted_queries : Optional[:class:`PersistedQueryRegistry`], optional
+            The registry to remember which queries the API has persisted in, so queries are sent by hash from the first request after a restart, by default None (hashes are only remembered per Query)
         """
         self.api_key: str = api_key
         self.bot_key: Optional[str] = bot_key
         self.bot_key_api_key: Optional[str] = bot_key_api_key
         self.parse_int: Optional[Callable[[str], Any]] = parse_int
         self.parse_float: Optional[Callable[[str], Any]] = parse_float
+        self.decoder: Decoder = decoder or default_decoder(parse_int, parse_float)
         self.url: str = url or "https://api.politicsandwar.com/graphql"
         self.socket_url: str = (
             socket_url
@@ -241,13 +302,122 @@ class QueryKit:
             subscription_auth_url
             or "https://api.politicsandwar.com/subscriptions/v1/auth"
         )
-        self.rate_limit: RateLimit = RateLimit.get(self.url)
+        self.rate_limit: RateLimit = self.get_rate_limit(
+            self.api_key, shared_rate_limit
+        )
+        self.bot_rate_limit: RateLimit = (
+            self.rate_limit
+            if self.bot_key is None
+            else self.get_rate_limit(self.bot_key, shared_rate_limit)
+        )
+        self.key_pool: Optional[KeyPool] = (
+            KeyPool(
+                [
+                    PooledKey(i, self.get_rate_limit(i, shared_rate_limit))
+                    for i in dict.fromkeys([self.api_key, *api_keys])
+                ]
+            )
+            if api_keys
+            else None
+        )
+        if daily_budget:
+            for rate_limit in self.rate_limits():
+                # bot keys don't have a daily budget that can be checked
+                if (
+                    rate_limit is self.rate_limit
+                    or rate_limit is not self.bot_rate_limit
+                ):
+                    rate_limit.budget = rate_limit.budget or DailyBudget()
         self.socket: Optional[Socket] = socket
         self.aiohttp_session: Optional[aiohttp.ClientSession] = aiohttp_session
         self.requests_session: Optional[requests.Session] = requests_session
+        self.batcher: Optional[QueryBatcher] = (
+            None
+            if batch_window is None
+            else QueryBatcher(self, batch_window, batch_max_fields)
+        )
+        self.deduplicate: bool = deduplicate
+        self.in_flight: Dict[Tuple[str, ...], asyncio.Future[Any]] = {}
+        self.cache: Optional[ResultCache] = cache
+        self.retry_policy: Optional[RetryPolicy] = retry_policy
+        self.timeout: Optional[float] = timeout
+        self.hedge_policy: Optional[HedgePolicy] = hedge_policy
+        self.persisted_queries: Optional[PersistedQueryRegistry] = persisted_queries
+
+    def get_rate_limit(
+        self,
+        key: str,
+        shared: Optional[Union[str, Callable[[str, str], RateLimit]]] = None,
+    ) -> RateLimit:
+        if callable(shared):
+            rate_limit = RATE_LIMITS[self.url, key] = shared(self.url, key)
+            return rate_limit
+        if shared is not None:
+            return SharedRateLimit.get(self.url, key, shared)
+        return RateLimit.get(self.url, key)
+
+    def rate_limits(self) -> List[RateLimit]:
+        """Get the rate limits of every key the QueryKit uses
+
+        Returns
+        -------
+        List[RateLimit]
+            The rate limits
+        """
+        rate_limits = [self.rate_limit, self.bot_rate_limit]
+        if self.key_pool is not None:
+            rate_limits.extend(i.rate_limit for i in self.key_pool.keys)
+        return list(dict.fromkeys(rate_limits))
+
+    def budget_query(self, rate_limit: RateLimit) -> Query[Result]:
+        query = self.query("me", {}, "requests max_requests")
+        query.api_key = rate_limit.key
+        return query
+
+    def reconcile_budget(self, rate_limit: RateLimit) -> None:
+        """Check a rate limit's daily budget against the API synchronously
+
+        Parameters
+        ----------
+        rate_limit : RateLimit
+            The rate limit with the budget to check
+        """
+        budget = rate_limit.budget
+        if budget is None:
+            return
+        budget.reconciling = True
+        try:
+            me = self.budget_query(rate_limit).get(cache=False).me
+            budget.reconcile(me.requests, me.max_requests)
+        except Exception as e:
+            logger.warning("Failed to check daily budget", exc_info=e)
+            budget.reconciled_at = time.monotonic()
+        finally:
+            budget.reconciling = False
+
+    async def reconcile_budget_async(self, rate_limit: RateLimit) -> None:
+        """Check a rate limit's daily budget against the API asynchronously
+
+        Parameters
+        ----------
+        rate_limit : RateLimit
+            The rate limit with the budget to check
+        """
+        budget = rate_limit.budget
+        if budget is None:
+            return
+        budget.reconciling = True
+        try:
+            me = (await self.budget_query(rate_limit).get_async(cache=False)).me
+            budget.reconcile(me.requests, me.max_requests)
+        except Exception as e:
+            logger.warning("Failed to check daily budget", exc_info=e)
+            budget.reconciled_at = time.monotonic()
+        finally:
+            budget.reconciling = False
 
-    def loads(self, text: str) -> Dict[str, Any]:
-        return json.loads(text, parse_int=self.parse_int, parse_float=self.parse_float)
+    def loads(self, text: Union[str, bytes]) -> Dict[str, Any]:
+        return self.decoder.loads(text)
 
     def query(
         self,
@@ -542,6 +712,81 @@ class QueryKit:
             field, arguments, *fields  # type: ignore
         )
 
+    @overload
+    def loader(
+        self, field: Literal["nations"], *fields: FieldValue
+    ) -> Loader[data_classes.Nation]:
+        ...
+
+    @overload
+    def loader(
+        self, field: Literal["alliances"], *fields: FieldValue
+    ) -> Loader[data_classes.Alliance]:
+        ...
+
+    @overload
+    def loader(
+        self, field: Literal["cities"], *fields: FieldValue
+    ) -> Loader[data_classes.City]:
+        ...
+
+    @overload
+    def loader(
+        self, field: Literal["wars"], *fields: FieldValue
+    ) -> Loader[data_classes.War]:
+        ...
+
+    @overload
+    def loader(
+        self, field: Literal["warattacks"], *fields: FieldValue
+    ) -> Loader[data_classes.WarAttack]:
+        ...
+
+    @overload
+    def loader(
+        self, field: Literal["bankrecs"], *fields: FieldValue
+    ) -> Loader[data_classes.Bankrec]:
+        ...
+
+    @overload
+    def loader(
+        self, field: Literal["trades"], *fields: FieldValue
+    ) -> Loader[data_classes.Trade]:
+        ...
+
+    @overload
+    def loader(
+        self, field: Literal["treaties"], *fields: FieldValue
+    ) -> Loader[data_classes.Treaty]:
+        ...
+
+    @overload
+    def loader(
+        self, field: Literal["bounties"], *fields: FieldValue
+    ) -> Loader[data_classes.Bounty]:
+        ...
+
+    @overload
+    def loader(self, field: str, *fields: FieldValue) -> Loader[Any]:
+        ...
+
+    def loader(self, field: str, *fields: FieldValue) -> Loader[Any]:
+        """Create a :class:`Loader` that coalesces lookups by ID into a single query
+
+        Parameters
+        ----------
+        field : str
+            The name of the root field to load from, it must accept an ``id`` argument
+        fields: Union[str, :class:`Field`]
+            The fields to fetch for each item, ``id`` is always fetched
+
+        Returns
+        -------
+        Loader[Any]
+            The Loader with it's type corresponding to the type of the field provided
+        """
+        return Loader[Any](self, field, *fields)
+
     async def subscribe_internal(self, subscription: Subscription[Any]) -> None:
         logger.debug("subscribe_internal - Subscribing to %s", subscription)
         if self.socket is None:
@@ -570,8 +815,34 @@ class QueryKit:
             raise errors.GraphQLError("\n".join(i["message"] for i in response_errors))
 
 
+class CompiledQuery:
+    """The resolved text of a query along with its hash and persisted query extension, shared by every request made with the query and any made from it with :meth:`Query.set_variables`"""
+
+    __slots__ = ("text", "hash", "extensions")
+
+    def __init__(self, text: str) -> None:
+        self.text: str
+        self.hash: str
+        self.extensions: str
+        hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        object.__setattr__(self, "text", text)
+        object.__setattr__(self, "hash", hash)
+        object.__setattr__(self, "extensions", self.persisted_query(hash))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    @staticmethod
+    def persisted_query(hash: str) -> str:
+        return json.dumps(
+            {"persistedQuery": {"version": 1, "sha256Hash": hash}},
+            separators=(",", ":"),
+        )
+
+
 class Query(Generic[R]):
     ROOT: ClassVar[str] = "query"
+    PRIORITY: ClassVar[Priority] = Priority.INTERACTIVE
 
     def __init__(
         self,
@@ -580,6 +851,7 @@ class Query(Generic[R]):
         variables: Optional[Dict[str, Variable]] = None,
         variable_values: Optional[Dict[str, Any]] = None,
         hash: Optional[str] = None,
+        priority: Optional[Priority] = None,
     ) -> None:
         """Represents a GraphQL Query
 
@@ -595,6 +867,8 @@ class Query(Generic[R]):
             The values for each variable, by default None
         hash : Optional[str], optional
             The query hash for use with the API's Automatic Persisted Queries feature, by default None
+        priority : Optional[Priority], optional
+            The priority of the query's requests when waiting on the rate limit, by default Priority.INTERACTIVE for queries and Priority.MUTATION for mutations
         """
         self.kit: QueryKit = kit
         self.fields: MutableSequence[Field] = list(fields)
@@ -602,6 +876,10 @@ class Query(Generic[R]):
         self.variable_values: Dict[str, Any] = variable_values or {}
         self.hash: Optional[str] = hash
         self.resolved_hash: Optional[str] = None
+        self.compiled: Optional[CompiledQuery] = None
+        self.response_size: int = 0
+        self.priority: Priority = self.PRIORITY if priority is None else priority
+        self.api_key: Optional[str] = None
 
     def query(
         self,
@@ -626,6 +904,7 @@ class Query(Generic[R]):
             Returns the Query for support for method chaining
         """
         self.hash = self.resolved_hash = None
+        self.compiled = None
         self.fields.append(Field.add(self, field, arguments, root=True, *fields))
         return self
 
@@ -657,6 +936,7 @@ class Query(Generic[R]):
             Returns the Query for support for method chaining
         """
         self.hash = self.resolved_hash = None
+        self.compiled = None
         self.fields.append(
             Field.add(
                 self,
@@ -669,37 +949,181 @@ class Query(Generic[R]):
         )
         return self
 
-    def actual_sync_request(self, headers: Optional[Dict[str, Any]]) -> Tuple[str, int]:
+    @property
+    def rate_limit(self) -> RateLimit:
+        return self.kit.rate_limit
+
+    def prioritize(self, priority: Priority, /) -> Self:
+        """Set the priority of the query's requests when waiting on the rate limit
+
+        Parameters
+        ----------
+        priority : Priority
+            The priority to use
+
+        Returns
+        -------
+        Self
+            Returns the Query for support for method chaining
+        """
+        self.priority = priority
+        return self
+
+    def deadline(self, timeout: Optional[float] = None) -> Optional[float]:
+        timeout = self.kit.timeout if timeout is None else timeout
+        return None if timeout is None else time.monotonic() + timeout
+
+    def time_left(self, deadline: Optional[float], wait: float = 0) -> Optional[float]:
+        """Returns the number of seconds until the deadline, raising :class:`DeadlineExceeded` if waiting for ``wait`` seconds would pass it"""
+        if deadline is None:
+            return None
+        left = deadline - time.monotonic()
+        if left <= wait:
+            if wait > 0:
+                raise errors.DeadlineExceeded(
+                    f"Request would wait {wait:.2f} seconds with {max(left, 0):.2f} seconds left"
+                )
+            raise errors.DeadlineExceeded(
+                "Request did not complete before its deadline"
+            )
+        return left
+
+    async def wait_until(
+        self, awaitable: Awaitable[T_co], deadline: Optional[float]
+    ) -> T_co:
+        if deadline is None:
+            return await awaitable
+        try:
+            return await asyncio.wait_for(awaitable, self.time_left(deadline))
+        except asyncio.TimeoutError:
+            raise errors.DeadlineExceeded(
+                "Request did not complete before its deadline"
+            ) from None
+
+    def select_key(self) -> Optional[PooledKey]:
+        if self.kit.key_pool is None or self.ROOT != "query":
+            return None
+        if self.api_key is not None:
+            return next(
+                (i for i in self.kit.key_pool.keys if i.key == self.api_key), None
+            )
+        return self.kit.key_pool.select()
+
+    def handle_key_response(self, key: Optional[PooledKey], status: int) -> bool:
+        """Returns whether the request should be sent again with another key"""
+        if key is None or self.kit.key_pool is None:
+            return False
+        if status in {401, 403}:
+            logger.warning("Removing key ...%s from the pool", key.key[-4:])
+            self.kit.key_pool.remove(key)
+            return True
+        if status == 429:
+            self.kit.key_pool.throttle(key)
+            return True
+        self.kit.key_pool.succeeded(key)
+        return False
+
+    def actual_sync_request(
+        self, headers: Optional[Dict[str, Any]], deadline: Optional[float] = None
+    ) -> Tuple[str, int]:
         if self.kit.requests_session is None:
             self.kit.requests_session = requests.Session()
-        request_params = self.request_params(headers)
         for _ in range(5):
+            key = self.select_key()
+            rate_limit = self.rate_limit if key is None else key.rate_limit
+            request_params = self.request_params(headers, key and key.key)
+            budget = rate_limit.budget
+            if budget is not None:
+                if budget.needs_reconcile:
+                    self.kit.reconcile_budget(rate_limit)
+                wait = budget.schedule(self.priority)
+                if wait > 0:
+                    self.time_left(deadline, wait)
+                    logger.debug("Pacing request for %s seconds", wait)
+                    time.sleep(wait)
             while True:
-                wait = self.kit.rate_limit.hit()
+                wait = rate_limit.hit(self.priority)
                 if wait > 0:
+                    self.time_left(deadline, wait)
                     time.sleep(wait)
                 else:
                     break
-            with self.kit.requests_session.request(**request_params) as response:
-                if not self.kit.rate_limit.initialized:
-                    self.kit.rate_limit.initialize(response.headers)
+            try:
+                left = self.time_left(deadline)
+            except errors.DeadlineExceeded:
+                rate_limit.restore()
+                raise
+            if left is not None:
+                # requests only applies the timeout to each socket operation,
+                # the body is streamed so the deadline can be checked as it's read
+                request_params["timeout"] = left
+                request_params["stream"] = True
+            try:
+                response = self.kit.requests_session.request(**request_params)
+            except requests.Timeout as e:
+                rate_limit.abandon()
+                if deadline is None:
+                    raise
+                raise errors.DeadlineExceeded(
+                    "Request did not complete before its deadline"
+                ) from e
+            except BaseException:
+                rate_limit.abandon()
+                raise
+            with response:
+                rate_limit.update(response.headers)
                 if response.status_code == 429:
-                    wait = self.kit.rate_limit.handle_429(
+                    wait = rate_limit.handle_429(
                         response.headers.get("X-RateLimit-Reset")
                     )
+                    if self.handle_key_response(key, response.status_code):
+                        continue
                     if wait is not None:
+                        self.time_left(deadline, wait)
                         time.sleep(wait)
                         continue
-                return response.text, response.status_code
+                elif self.handle_key_response(key, response.status_code):
+                    continue
+                if deadline is None:
+                    return response.text, response.status_code
+                return self.read_sync_body(response, deadline), response.status_code
         raise errors.MaxTriesExceededError()
 
-    def get(self, headers: Optional[Dict[str, Any]] = None) -> R:
+    def read_sync_body(self, response: requests.Response, deadline: float) -> str:
+        """Read the body of a streamed response, raising :class:`DeadlineExceeded` if the deadline passes while it's read"""
+        chunks: List[bytes] = []
+        try:
+            for chunk in response.iter_content(1024):
+                chunks.append(chunk)
+                self.time_left(deadline)
+        except (requests.Timeout, requests.ConnectionError) as e:
+            if time.monotonic() < deadline:
+                raise
+            raise errors.DeadlineExceeded(
+                "Request did not complete before its deadline"
+            ) from e
+        return b"".join(chunks).decode(response.encoding or "utf-8", "replace")
+
+    def get(
+        self,
+        headers: Optional[Dict[str, Any]] = None,
+        *,
+        cache: bool = True,
+        refresh: bool = False,
+        timeout: Optional[float] = None,
+    ) -> R:
         """Fetch the results of the query synchronously using requests
 
         Parameters
         ----------
         headers : Optional[Dict[str, Any]], optional
             Any additional headers to pass with the query, by default None
+        cache : bool, optional
+            Whether to use the QueryKit's cache for this query, by default True
+        refresh : bool, optional
+            Whether to skip any cached result and replace it with a fresh one, by default False
+        timeout : Optional[float], optional
+            The number of seconds the query has to complete in, including waiting on the rate limit and retries, raising :class:`DeadlineExceeded` if it can't, by default the QueryKit's timeout. requests can only time out each read of the response, so the body is checked against the deadline after every kilobyte read, a body arriving slower than that can still overrun it
 
         Returns
         -------
@@ -707,48 +1131,105 @@ class Query(Generic[R]):
             The :class:`Result` of the Query
         """
         self.check_validity()
+        if cache and not refresh:
+            result = self.cached(headers)
+            if result is not None:
+                return result
+        deadline = self.deadline(timeout)
         try:
-            return self.parse_result(*self.actual_sync_request((headers)))
+            result = self.request(headers, self.parse_result, deadline)
         except errors.PersistedQueryNotFound:
-            return self.parse_result(*self.actual_sync_request((headers)))
+            result = self.request(headers, self.parse_result, deadline)
+        if cache:
+            self.store(headers, result)
+        return result
 
     async def actual_async_request(
-        self, headers: Optional[Dict[str, Any]]
+        self, headers: Optional[Dict[str, Any]], deadline: Optional[float] = None
     ) -> Tuple[str, int]:
         if self.kit.aiohttp_session is None:
             self.kit.aiohttp_session = aiohttp.ClientSession()
-        request_params = self.request_params(headers)
         for _ in range(5):
-            while True:
-                wait = self.kit.rate_limit.hit()
+            key = self.select_key()
+            rate_limit = self.rate_limit if key is None else key.rate_limit
+            request_params = self.request_params(headers, key and key.key)
+            budget = rate_limit.budget
+            if budget is not None:
+                if budget.needs_reconcile:
+                    budget.reconciling = True
+                    asyncio.create_task(self.kit.reconcile_budget_async(rate_limit))
+                wait = budget.schedule(self.priority)
                 if wait > 0:
+                    self.time_left(deadline, wait)
+                    logger.debug("Pacing request for %s seconds", wait)
                     await asyncio.sleep(wait)
-                else:
-                    break
-            async with self.kit.aiohttp_session.request(
-                **request_params,
-            ) as response:
-                if not self.kit.rate_limit.initialized:
-                    self.kit.rate_limit.initialize(response.headers)
-                if response.status == 429:
-                    wait = self.kit.rate_limit.handle_429(
-                        response.headers.get("X-RateLimit-Reset")
+            if deadline is not None:
+                self.time_left(deadline, rate_limit.wait_time(self.priority))
+            await self.wait_until(rate_limit.acquire(self.priority), deadline)
+            try:
+                left = self.time_left(deadline)
+            except errors.DeadlineExceeded:
+                rate_limit.release()
+                raise
+            if left is not None:
+                request_params["timeout"] = aiohttp.ClientTimeout(total=left)
+            started = time.monotonic()
+            try:
+                try:
+                    response = await self.kit.aiohttp_session.request(
+                        **request_params,
                     )
-                    if wait is not None:
-                        await asyncio.sleep(wait)
+                except BaseException:
+                    # no headers will reconcile this request, including when a hedge cancels it
+                    rate_limit.abandon()
+                    raise
+                async with response:
+                    rate_limit.update(response.headers)
+                    if response.status == 429:
+                        wait = rate_limit.handle_429(
+                            response.headers.get("X-RateLimit-Reset")
+                        )
+                        if self.handle_key_response(key, response.status):
+                            continue
+                        if wait is not None:
+                            self.time_left(deadline, wait)
+                            await asyncio.sleep(wait)
+                            continue
+                    elif self.handle_key_response(key, response.status):
                         continue
-                text = await response.text()
-                status = response.status
-                return text, status
+                    text = await response.text()
+                    status = response.status
+                    if self.kit.hedge_policy is not None:
+                        self.kit.hedge_policy.record(time.monotonic() - started)
+                    return text, status
+            except asyncio.TimeoutError as e:
+                if deadline is None:
+                    raise
+                raise errors.DeadlineExceeded(
+                    "Request did not complete before its deadline"
+                ) from e
         raise errors.MaxTriesExceededError()
 
-    async def get_async(self, headers: Optional[Dict[str, Any]] = None) -> R:
+    async def get_async(
+        self,
+        headers: Optional[Dict[str, Any]] = None,
+        *,
+        cache: bool = True,
+        refresh: bool = False,
+        timeout: Optional[float] = None,
+    ) -> R:
         """Fetch the results of the query asynchronously using aiohttp, simply using the ``await`` statement on the Query will also call this method
 
         Parameters
         ----------
         headers : Optional[Dict[str, Any]], optional
             Any additional headers to pass with the query, by default None
+        cache : bool, optional
+            Whether to use the QueryKit's cache for this query, by default True
+        refresh : bool, optional
+            Whether to skip any cached result and replace it with a fresh one, by default False
+        timeout : Optional[float], optional
+            The number of seconds the query has to complete in, including waiting on the rate limit and retries, raising :class:`DeadlineExceeded` if it can't, by default the QueryKit's timeout
 
         Returns
         -------
@@ -756,47 +1237,309 @@ class Query(Generic[R]):
             The :class:`Result` of the Query
         """
         self.check_validity()
+        if cache and not refresh:
+            result = self.cached(headers, revalidate=True)
+            if result is not None:
+                return result
+        deadline = self.deadline(timeout)
+        if self.kit.deduplicate and self.ROOT == "query":
+            return await self.deduplicated_async(headers, cache, deadline)
+        return await self.dispatch_async(headers, cache, deadline)
+
+    async def deduplicated_async(
+        self,
+        headers: Optional[Dict[str, Any]],
+        cache: bool = False,
+        deadline: Optional[float] = None,
+    ) -> R:
+        key = self.request_key(headers)
+        future = self.kit.in_flight.get(key)
+        if future is not None:
+            try:
+                return await self.wait_until(asyncio.shield(future), deadline)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # the request being waited on was cancelled, so make it again
+                return await self.deduplicated_async(headers, cache, deadline)
+            except errors.DeadlineExceeded:
+                if (
+                    future.done()
+                    and not future.cancelled()
+                    and future.exception() is not None
+                ):
+                    # the request being waited on ran out of its own time, not this one's
+                    self.time_left(deadline)
+                    return await self.deduplicated_async(headers, cache, deadline)
+                raise
+        future = asyncio.get_running_loop().create_future()
+        self.kit.in_flight[key] = future
+        try:
+            result = await self.dispatch_async(headers, cache, deadline)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # mark the exception as retrieved in case nothing else was waiting
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            self.kit.in_flight.pop(key, None)
+        return result
+
+    async def dispatch_async(
+        self,
+        headers: Optional[Dict[str, Any]],
+        cache: bool = False,
+        deadline: Optional[float] = None,
+    ) -> R:
+        if (
+            headers is None
+            and self.kit.batcher is not None
+            and self.kit.batcher.can_batch(self)
+        ):
+            result = await self.kit.batcher.submit(self, deadline)
+        else:
+            result = await self.fetch_async(headers, deadline)
+        if cache:
+            self.store(headers, result)
+        return result
+
+    def cached(
+        self, headers: Optional[Dict[str, Any]], revalidate: bool = False
+    ) -> Optional[R]:
+        if self.kit.cache is None or self.ROOT != "query":
+            return None
+        key = self.request_key(headers)
+        result, stale = self.kit.cache.lookup(key)
+        if not stale:
+            return result
+        if not revalidate:
+            return None
+        if key not in self.kit.cache.refreshing:
+            logger.debug("Revalidating stale result for %s", key[0])
+            self.kit.cache.refreshing[key] = asyncio.create_task(
+                self.revalidate(headers, key)
+            )
+        return result
+
+    async def revalidate(
+        self, headers: Optional[Dict[str, Any]], key: Tuple[str, ...]
+    ) -> None:
+        try:
+            await self.get_async(headers, refresh=True)
+        except Exception as e:
+            logger.warning("Failed to revalidate stale result", exc_info=e)
+        finally:
+            if self.kit.cache is not None:
+                self.kit.cache.refreshing.pop(key, None)
+
+    def store(self, headers: Optional[Dict[str, Any]], result: R) -> None:
+        if self.kit.cache is None or self.ROOT != "query":
+            return
+        self.kit.cache.set(
+            self.request_key(headers),
+            result,
+            self.kit.cache.ttl_for(i.name for i in self.fields),
+            self.response_size,
+        )
+
+    async def fetch_async(
+        self,
+        headers: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None,
+    ) -> R:
         try:
-            return self.parse_result(*(await self.actual_async_request(headers)))
+            return await self.request_async(headers, self.parse_result, deadline)
         except errors.PersistedQueryNotFound:
-            return self.parse_result(*(await self.actual_async_request(headers)))
+            return await self.request_async(headers, self.parse_result, deadline)
+
+    async def hedged_async_request(
+        self, headers: Optional[Dict[str, Any]], deadline: Optional[float] = None
+    ) -> Tuple[str, int]:
+        policy = self.kit.hedge_policy
+        delay = None if policy is None or self.ROOT != "query" else policy.delay()
+        if policy is None or delay is None:
+            return await self.actual_async_request(headers, deadline)
+        tasks = {asyncio.ensure_future(self.actual_async_request(headers, deadline))}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            key = self.select_key()
+            rate_limit = self.rate_limit if key is None else key.rate_limit
+            if done or not policy.can_hedge(rate_limit, self.priority):
+                return await next(iter(tasks))
+            logger.debug("Hedging request after %s seconds", delay)
+            policy.hedged += 1
+            first = next(iter(tasks))
+            tasks.add(
+                asyncio.ensure_future(self.actual_async_request(headers, deadline))
+            )
+            error: Optional[BaseException] = None
+            while tasks:
+                done, tasks = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is not first:
+                            policy.won += 1
+                        return task.result()
+                    error = error or task.exception()
+            assert error is not None
+            raise error
+        finally:
+            # the slower request is no longer needed
+            for task in tasks:
+                task.cancel()
+
+    def retry_wait(
+        self, error: BaseException, attempt: int, deadline: Optional[float] = None
+    ) -> Optional[float]:
+        policy = self.kit.retry_policy
+        if policy is None or not policy.should_retry(
+            error, attempt, self.ROOT == "mutation"
+        ):
+            return None
+        wait = policy.backoff(attempt)
+        if deadline is not None and time.monotonic() + wait >= deadline:
+            # raise the original error rather than one for a deadline not yet passed
+            return None
+        logger.debug("Retrying request in %s seconds after %r", wait, error)
+        return wait
+
+    def check_status(self, text: str, status: int) -> None:
+        policy = self.kit.retry_policy
+        if policy is not None and status in policy.statuses:
+            raise errors.InvalidResponse(text, status)
+
+    def request(
+        self,
+        headers: Optional[Dict[str, Any]],
+        parse: Callable[[str, int], T_co],
+        deadline: Optional[float] = None,
+    ) -> T_co:
+        """Send the query and parse the response synchronously, retrying as allowed by the QueryKit's retry policy"""
+        if self.kit.retry_policy is not None:
+            self.kit.retry_policy.deposit()
+        attempt = 0
+        while True:
+            try:
+                text, status = self.actual_sync_request(headers, deadline)
+                self.check_status(text, status)
+                return parse(text, status)
+            except Exception as e:
+                wait = self.retry_wait(e, attempt, deadline)
+                if wait is None:
+                    raise
+            time.sleep(wait)
+            attempt += 1
+
+    async def request_async(
+        self,
+        headers: Optional[Dict[str, Any]],
+        parse: Callable[[str, int], T_co],
+        deadline: Optional[float] = None,
+    ) -> T_co:
+        """Send the query and parse the response asynchronously, retrying as allowed by the QueryKit's retry policy"""
+        if self.kit.retry_policy is not None:
+            self.kit.retry_policy.deposit()
+        attempt = 0
+        while True:
+            try:
+                text, status = await self.hedged_async_request(headers, deadline)
+                self.check_status(text, status)
+                return parse(text, status)
+            except Exception as e:
+                wait = self.retry_wait(e, attempt, deadline)
+                if wait is None:
+                    raise
+            await asyncio.sleep(wait)
+            attempt += 1
 
     def __await__(
         self, headers: Optional[Dict[str, Any]] = None
     ) -> Generator[Any, None, R]:
         return self.get_async(headers).__await__()
 
-    def request_params(self, headers: Optional[Dict[str, Any]]) -> Dict[str, Any]:
-        self.resolved_hash = (
-            self.resolved_hash
-            or hashlib.sha256(self.resolve().encode("utf-8")).hexdigest()
+    def compile(self) -> CompiledQuery:
+        """Resolve the query's text, hash, and persisted query extension once and reuse them for every request, adding fields to the query discards them
+
+        Returns
+        -------
+        CompiledQuery
+            The compiled query
+        """
+        if self.compiled is None:
+            self.compiled = CompiledQuery(self.resolve())
+        return self.compiled
+
+    def resolve_hash(self) -> str:
+        self.resolved_hash = self.compile().hash
+        return self.resolved_hash
+
+    def request_key(self, headers: Optional[Dict[str, Any]] = None) -> Tuple[str, ...]:
+        return (
+            self.resolve_hash(),
+            json.dumps(self.variable_values, sort_keys=True, default=str),
+            json.dumps(headers, sort_keys=True, default=str),
+            self.api_key or "",
         )
+
+    def request_params(
+        self, headers: Optional[Dict[str, Any]], api_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        compiled = self.compile()
+        self.resolved_hash = compiled.hash
+        if self.hash is not None and self.hash != compiled.hash:
+            # the hash is for a different query, sending it with these variables
+            # would run that query instead
+            self.hash = None
+        if (
+            self.hash is None
+            and self.kit.persisted_queries is not None
+            and self.kit.persisted_queries.confirmed(self.kit.url, compiled.hash)
+        ):
+            self.hash = compiled.hash
+        params = {
+            "api_key": api_key or self.api_key or self.kit.api_key,
+            "extensions": compiled.extensions,
+        }
+        if self.hash is not None and self.variable_values:
+            # persisted queries are sent without a body, so variables go in the URL
+            params["variables"] = json.dumps(
+                self.variable_values, separators=(",", ":")
+            )
         return {
             "method": "POST" if self.hash is None else "GET",
             "url": self.kit.url,
-            "json": {"query": self.resolve(), "variables": self.variable_values}
+            "json": {"query": compiled.text, "variables": self.variable_values}
             if self.hash is None
             else None,
             "headers": headers,
-            "params": {
-                "api_key": self.kit.api_key,
-                "extensions": json.dumps(
-                    {
-                        "persistedQuery": {
-                            "version": 1,
-                            "sha256Hash": self.hash or self.resolved_hash,
-                        }
-                    },
-                    separators=(",", ":"),
-                ),
-            },
+            "params": params,
         }
 
     def parse_result(self, text: str, status: int) -> R:
+        self.response_size = len(text)
         try:
             data = self.kit.loads(text)
         except json.JSONDecodeError as e:
             raise errors.InvalidResponse(text, status) from e
+        self.check_response_for_errors(data)
+        self.confirm_hash()
+        # doesn't like the R
+        return Result.from_data(data["data"])  # type: ignore
+
+    def confirm_hash(self) -> None:
+        """Mark the query as persisted by the API after a successful response, so later requests are sent by hash"""
+        self.hash = self.resolve_hash()
+        if self.kit.persisted_queries is not None:
+            self.kit.persisted_queries.confirm(self.kit.url, self.hash)
+
+    def check_response_for_errors(self, data: Dict[str, Any]) -> None:
         response_errors = self.kit.get_response_errors(data)
         try:
             self.kit.raise_response_errors(response_errors)
@@ -807,12 +1550,13 @@ class Query(Generic[R]):
                 and code == "PERSISTED_QUERY_NOT_FOUND"
                 for i in response_errors
             ):
+                if self.kit.persisted_queries is not None:
+                    self.kit.persisted_queries.invalidate(
+                        self.kit.url, self.hash or self.resolve_hash()
+                    )
                 self.hash = None
                 raise errors.PersistedQueryNotFound() from e
             raise e
-        # doesn't like the R
-        self.hash = self.resolved_hash
-        return Result.from_data(data["data"])  # type: ignore
 
     def check_validity(self) -> None:
         if any(
@@ -834,14 +1578,17 @@ class Query(Generic[R]):
         Self
             The Query for support with method chaining
         """
-        query = Query[R](
+        query = type(self)(
             self.kit,
             *self.fields,
             variables=self.variables.copy(),
             variable_values={**self.variable_values, **variables},
             hash=self.hash,
+            priority=self.priority,
         )
-        query.resolved_hash = self.resolved_hash
+        # the text doesn't depend on variable values, so it is only resolved once
+        query.compiled = self.compile()
+        query.resolved_hash = query.compiled.hash
         return query
 
     def resolve(self) -> str:
@@ -863,12 +1610,13 @@ class Query(Generic[R]):
         Self
             Returns a cloned instance of the query
         """
-        return Query[R](
+        return type(self)(
             self.kit,
             *self.fields,
             variables=self.variables.copy(),
             variable_values=self.variable_values.copy(),
             hash=self.hash,
+            priority=self.priority,
         )
 
     @overload
@@ -962,6 +1710,232 @@ class Query(Generic[R]):
         """
         return Paginator[Any].from_query(self, field)
 
+    @overload
+    def shard(
+        self,
+        field: Literal["nations"],
+        max_id: int,
+        /,
+        shards: int = 4,
+        *,
+        min_id: int = 1,
+    ) -> ShardedPaginator[data_classes.Nation]:
+        ...
+
+    @overload
+    def shard(
+        self,
+        field: Literal["alliances"],
+        max_id: int,
+        /,
+        shards: int = 4,
+        *,
+        min_id: int = 1,
+    ) -> ShardedPaginator[data_classes.Alliance]:
+        ...
+
+    @overload
+    def shard(
+        self,
+        field: Literal["tradeprices"],
+        max_id: int,
+        /,
+        shards: int = 4,
+        *,
+        min_id: int = 1,
+    ) -> ShardedPaginator[data_classes.Tradeprice]:
+        ...
+
+    @overload
+    def shard(
+        self,
+        field: Literal["trades"],
+        max_id: int,
+        /,
+        shards: int = 4,
+        *,
+        min_id: int = 1,
+    ) -> ShardedPaginator[data_classes.Trade]:
+        ...
+
+    @overload
+    def shard(
+        self,
+        field: Literal["wars"],
+        max_id: int,
+        /,
+        shards: int = 4,
+        *,
+        min_id: int = 1,
+    ) -> ShardedPaginator[data_classes.War]:
+        ...
+
+    @overload
+    def shard(
+        self,
+        field: Literal["bounties"],
+        max_id: int,
+        /,
+        shards: int = 4,
+        *,
+        min_id: int = 1,
+    ) -> ShardedPaginator[data_classes.Bounty]:
+        ...
+
+    @overload
+    def shard(
+        self,
+        field: Literal["warattacks"],
+        max_id: int,
+        /,
+        shards: int = 4,
+        *,
+        min_id: int = 1,
+    ) -> ShardedPaginator[data_classes.WarAttack]:
+        ...
+
+    @overload
+    def shard(
+        self,
+        field: Literal["treaties"],
+        max_id: int,
+        /,
+        shards: int = 4,
+        *,
+        min_id: int = 1,
+    ) -> ShardedPaginator[data_classes.Treaty]:
+        ...
+
+    @overload
+    def shard(
+        self,
+        field: Literal["cities"],
+        max_id: int,
+        /,
+        shards: int = 4,
+        *,
+        min_id: int = 1,
+    ) -> ShardedPaginator[data_classes.City]:
+        ...
+
+    @overload
+    def shard(
+        self,
+        field: Literal["bankrecs"],
+        max_id: int,
+        /,
+        shards: int = 4,
+        *,
+        min_id: int = 1,
+    ) -> ShardedPaginator[data_classes.Bankrec]:
+        ...
+
+    @overload
+    def shard(
+        self,
+        field: Literal["baseball_games"],
+        max_id: int,
+        /,
+        shards: int = 4,
+        *,
+        min_id: int = 1,
+    ) -> ShardedPaginator[data_classes.BBGame]:
+        ...
+
+    @overload
+    def shard(
+        self,
+        field: Literal["baseball_teams"],
+        max_id: int,
+        /,
+        shards: int = 4,
+        *,
+        min_id: int = 1,
+    ) -> ShardedPaginator[data_classes.BBTeam]:
+        ...
+
+    @overload
+    def shard(
+        self,
+        field: Literal["baseball_players"],
+        max_id: int,
+        /,
+        shards: int = 4,
+        *,
+        min_id: int = 1,
+    ) -> ShardedPaginator[data_classes.BBPlayer]:
+        ...
+
+    @overload
+    def shard(
+        self,
+        field: Literal["treasure_trades"],
+        max_id: int,
+        /,
+        shards: int = 4,
+        *,
+        min_id: int = 1,
+    ) -> ShardedPaginator[data_classes.TreasureTrade]:
+        ...
+
+    @overload
+    def shard(
+        self,
+        field: Literal["embargoes"],
+        max_id: int,
+        /,
+        shards: int = 4,
+        *,
+        min_id: int = 1,
+    ) -> ShardedPaginator[data_classes.Embargo]:
+        ...
+
+    @overload
+    def shard(
+        self,
+        field: str,
+        max_id: int,
+        /,
+        shards: int = 4,
+        *,
+        min_id: int = 1,
+    ) -> ShardedPaginator[Any]:
+        ...
+
+    def shard(
+        self,
+        field: str,
+        max_id: int,
+        /,
+        shards: int = 4,
+        *,
+        min_id: int = 1,
+    ) -> ShardedPaginator[Any]:
+        """Get a :class:`ShardedPaginator` for paginating through a specific field split into ranges of IDs using the ``min_id`` and ``max_id`` arguments, avoiding deep pages
+
+        Parameters
+        ----------
+        field : str
+            The field to paginate
+        max_id : int
+            The highest ID to fetch, items created after the crawl starts are left out when this is the highest ID at the time
+        shards : int, optional
+            The number of ranges of IDs to split the field into, by default 4
+        min_id : int, optional
+            The lowest ID to fetch, by default 1
+
+        Returns
+        -------
+        ShardedPaginator[Any]
+            The ShardedPaginator with it's type corresponding to the type of the field provided
+
+        Raises
+        ------
+        ValueError
+            ``shards`` is less than 1 or ``max_id`` is lower than ``min_id``
+        """
+        return ShardedPaginator[Any].from_query(self, field, max_id, shards, min_id)
+
 
 class Result:
     me: data_classes.ApiKeyDetails
@@ -1000,7 +1974,153 @@ class Result:
         return self
 
 
-class Order(enum.Enum):
+class QueryBatcher:
+    def __init__(self, kit: QueryKit, window: float, max_fields: int) -> None:
+        """Coalesces queries awaited within a short window into a single request, aliasing each root field and splitting the response back out to each caller
+
+        Parameters
+        ----------
+        kit : QueryKit
+            The QueryKit the batched requests will be sent with
+        window : float
+            The number of seconds to wait for more queries after the first one arrives
+        max_fields : int
+            The maximum number of root fields to send in a single request
+        """
+        self.kit: QueryKit = kit
+        self.window: float = window
+        self.max_fields: int = max_fields
+        self.pending: List[Tuple[Query[Any], asyncio.Future[Any]]] = []
+        self.handle: Optional[asyncio.TimerHandle] = None
+
+    def can_batch(self, query: Query[Any]) -> bool:
+        # the combined request is sent with the pool's keys, so queries pinned
+        # to a key are sent on their own
+        return (
+            query.ROOT == "query"
+            and query.api_key is None
+            and 0 < len(query.fields) <= self.max_fields
+        )
+
+    async def submit(self, query: Query[R], deadline: Optional[float] = None) -> R:
+        if deadline is not None:
+            query.time_left(deadline, query.rate_limit.wait_time(query.priority))
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[R] = loop.create_future()
+        self.pending.append((query, future))
+        if sum(len(i.fields) for i, _ in self.pending) >= self.max_fields:
+            self.flush()
+        elif self.handle is None:
+            self.handle = loop.call_later(self.window, self.flush)
+        # the batch is sent with the QueryKit's timeout, each caller waits on its own
+        return await query.wait_until(future, deadline)
+
+    def flush(self) -> None:
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+        pending, self.pending = self.pending, []
+        for batch in self.split(pending):
+            asyncio.create_task(self.run(batch))
+
+    def split(
+        self, pending: List[Tuple[Query[Any], asyncio.Future[Any]]]
+    ) -> List[List[Tuple[Query[Any], asyncio.Future[Any]]]]:
+        batches: List[List[Tuple[Query[Any], asyncio.Future[Any]]]] = []
+        for item in pending:
+            for batch in batches:
+                if self.fits(batch, item[0]):
+                    batch.append(item)
+                    break
+            else:
+                batches.append([item])
+        return batches
+
+    def fits(
+        self, batch: List[Tuple[Query[Any], asyncio.Future[Any]]], query: Query[Any]
+    ) -> bool:
+        if sum(len(i.fields) for i, _ in batch) + len(query.fields) > self.max_fields:
+            return False
+        # variables are shared across the combined query, so they have to agree
+        for other, _ in batch:
+            for name, variable in query.variables.items():
+                if name not in other.variables:
+                    continue
+                if other.variables[
+                    name
+                ].type != variable.type or other.variable_values.get(
+                    name
+                ) != query.variable_values.get(
+                    name
+                ):
+                    return False
+        return True
+
+    def parse(self, text: str, status: int) -> Tuple[str, Dict[str, Any]]:
+        try:
+            return text, self.kit.loads(text)
+        except json.JSONDecodeError as e:
+            raise errors.InvalidResponse(text, status) from e
+
+    async def run(self, batch: List[Tuple[Query[Any], asyncio.Future[Any]]]) -> None:
+        if len(batch) == 1:
+            query, future = batch[0]
+            try:
+                result = await query.fetch_async(None, query.deadline())
+            except BaseException as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+            return
+        combined = Query[Result](
+            self.kit, priority=min(query.priority for query, _ in batch)
+        )
+        aliases: List[Dict[str, str]] = []
+        for index, (query, _) in enumerate(batch):
+            names: Dict[str, str] = {}
+            for field_index, field in enumerate(query.fields):
+                clone = field.clone()
+                clone.alias = f"b{index}_{field_index}"
+                combined.fields.append(clone)
+                names[clone.alias] = field.alias or field.name
+            combined.variables.update(query.variables)
+            combined.variable_values.update(query.variable_values)
+            aliases.append(names)
+        logger.debug("Sending batch of %s queries", len(batch))
+        try:
+            text, data = await combined.request_async(
+                None, self.parse, combined.deadline()
+            )
+        except BaseException as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        response_errors = self.kit.get_response_errors(data)
+        values: Dict[str, Any] = data.get("data") or {}
+        for names, (query, future) in zip(aliases, batch):
+            if future.done():
+                continue
+            query.response_size = len(text) // len(batch)
+            # errors without a path can't be attributed to a single query
+            query_errors = [
+                i for i in response_errors if not i.get("path") or i["path"][0] in names
+            ]
+            try:
+                self.kit.raise_response_errors(query_errors)
+            except errors.GraphQLError as e:
+                future.set_exception(e)
+                continue
+            future.set_result(
+                Result.from_data(
+                    {name: values.get(alias) for alias, name in names.items()}
+                )
+            )
+
+
+class Order(enum.Enum):
     ASC = "ASC"
     ASCENDING = "ASC"
     DESC = "DESC"
@@ -1123,7 +2243,8 @@ class Field:
             if resolved_fields and self.name in self.PAGINATOR_NAMES and self.root
             else resolved_fields
         )
-        return f"{self.name}{resolved_arguments}{resolved_fields}"
+        resolved_alias = f"{self.alias}:" if self.alias else ""
+        return f"{resolved_alias}{self.name}{resolved_arguments}{resolved_fields}"
 
     def resolve_arguments(self) -> str:
         return f"({', '.join(f'{name}:{self.resolve_argument(value)}' for name, value in self.arguments.items())})"
@@ -1156,6 +2277,25 @@ class Paginator(Generic[P]):
         self.queue: asyncio.Queue[P] = asyncio.Queue()
         self.batch_size: int = 1
         self.paginator_info: Optional[data_classes.PaginatorInfo] = None
+        self.concurrency: Optional[int] = None
+        self.ordered: bool = True
+        self.controller: Optional[AdaptiveConcurrency] = None
+        self.fanned_out: bool = False
+        self.fan_out_task: Optional[asyncio.Task[None]] = None
+        self.ready: Optional[asyncio.Event] = None
+        self.pages: Dict[int, List[P]] = {}
+        self.next_page: int = 0
+        self.max_items: Optional[int] = None
+        self.prefetch: int = 0
+        self.prefetch_task: Optional[asyncio.Task[None]] = None
+        self.page_items: int = 0
+        self.fetching: int = 0
+        self.drained: Optional[asyncio.Event] = None
+        self.closed: bool = False
+        self.queued_pages: Deque[List[int]] = collections.deque()
+        self.yielded_pages: Set[int] = set()
+        self.completed_page: int = query.variable_values.get("__page", 0)
+        self.sink: Optional[CheckpointSink] = None
 
     @classmethod
     def from_query(cls, query: Query[Any], name: str) -> Self:
@@ -1164,12 +2304,18 @@ class Paginator(Generic[P]):
             field = next(i for i in query.fields if i.name == name).clone()
         except StopIteration:
             raise RuntimeError(f"No query found for field {name}")
+        # pages are read from the response by the field's name
+        field.alias = None
         paginator_query = query.clone()
         __page = Variable("__page", VariableType.INT)
         field.arguments["page"] = __page
         paginator_query.fields = [field]
+        # the hash and text of the original query no longer match
+        paginator_query.hash = paginator_query.resolved_hash = None
+        paginator_query.compiled = None
         paginator_query.variables["__page"] = __page
         paginator_query.variable_values["__page"] = 0
+        paginator_query.priority = Priority.BACKGROUND
         return cls(query.kit, paginator_query)
 
     def __iter__(self) -> Self:
@@ -1184,50 +2330,422 @@ class Paginator(Generic[P]):
             return
         self.query.variable_values["__page"] += 1
         self.query.check_validity()
-        data, paginator_info = self.parse_result(*self.query.actual_sync_request(None))
+        data, paginator_info = self.fetch_page(self.query)
         self.paginator_info = paginator_info
-        for item in data:
-            self.queue.put_nowait(item)
+        self.enqueue(self.query.variable_values["__page"], data)
 
     def __next__(self) -> P:
         if self.queue.empty():
             self.fill()
         try:
-            return self.queue.get_nowait()
+            item = self.queue.get_nowait()
         except asyncio.QueueEmpty as e:
+            self.exhausted()
             raise StopIteration from e
+        self.advance()
+        return item
 
     async def fill_async(self) -> None:
         """Fills the queue with the next page of data"""
+        if self.prefetch_task is not None:
+            task = self.prefetch_task
+            self.prefetch_task = None
+            # raises any error from prefetching the pages
+            await task
+            if not self.queue.empty():
+                return
+        if self.fan_out_task is not None:
+            await self.wait_fan_out()
+            if not self.queue.empty():
+                return
+        await self.fetch_next_async(
+            self.batch_size if self.controller is None else self.controller.size
+        )
+
+    async def fetch_next_async(self, size: int) -> None:
         if self.paginator_info is not None and not self.paginator_info.hasMorePages:
             return
         self.query.check_validity()
+        if self.max_items is not None:
+            # only fetch as many pages as there is room for in the buffer, and
+            # a single page until it's known how many items a page has
+            size = (
+                min(
+                    size,
+                    max((self.max_items - self.queue.qsize()) // self.page_items, 1),
+                )
+                if self.page_items
+                else 1
+            )
         page = self.query.variable_values["__page"]
         last_page = self.paginator_info.lastPage if self.paginator_info else None
-        coros: List[Coroutine[Any, Any, Tuple[str, int]]] = [
-            self.query.set_variables(__page=page + i).actual_async_request(None)
-            for i in range(1, self.batch_size + 1)
+        pages = [
+            page + i
+            for i in range(1, size + 1)
             if last_page is None or page + i <= last_page
         ]
-        self.query.variable_values["__page"] = page + self.batch_size
-        # it's being really cranky about Never and stuff
-        responses = [self.parse_result(*i) for i in await asyncio.gather(*coros)]  # type: ignore
+        coros: List[
+            Coroutine[Any, Any, Tuple[List[Any], data_classes.PaginatorInfo]]
+        ] = [self.fetch_page_async(self.query.set_variables(__page=i)) for i in pages]
+        self.query.variable_values["__page"] = page + size
+        responses = await asyncio.gather(*coros)
         self.paginator_info = responses[-1][1]
-        for data, _ in responses:
-            for item in data:
-                self.queue.put_nowait(item)
+        for i, (data, _) in zip(pages, responses):
+            self.page_items = max(self.page_items, len(data))
+            self.enqueue(i, data)
+        if self.concurrency is not None and not self.fanned_out:
+            self.start_fan_out()
+
+    def start_fan_out(self) -> None:
+        self.fanned_out = True
+        page = self.query.variable_values["__page"]
+        last_page = self.paginator_info.lastPage if self.paginator_info else None
+        if last_page is None or page >= last_page:
+            return
+        # sequential filling picks up from here if pages are added during the fan out
+        self.query.variable_values["__page"] = last_page
+        self.next_page = page + 1
+        self.ready = asyncio.Event()
+        self.fan_out_task = asyncio.create_task(
+            self.run_fan_out(
+                weakref.ref(self),
+                self.ready,
+                iter(range(page + 1, last_page + 1)),
+                last_page,
+                self.concurrency or 1,
+            )
+        )
+        self.fan_out_task.add_done_callback(utils.retrieve_exception)
+        # the workers only hold the paginator while fetching a page, so an
+        # abandoned paginator is collected and its fan out cancelled
+        weakref.finalize(self, self.fan_out_task.cancel)
+
+    @staticmethod
+    async def run_fan_out(
+        reference: weakref.ref[Paginator[Any]],
+        ready: asyncio.Event,
+        pages: Iterator[int],
+        last_page: int,
+        concurrency: int,
+    ) -> None:
+        workers = [
+            asyncio.create_task(Paginator.fan_out_worker(reference, pages, last_page))
+            for _ in range(concurrency)
+        ]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            ready.set()
+
+    @staticmethod
+    async def fan_out_worker(
+        reference: weakref.ref[Paginator[Any]], pages: Iterator[int], last_page: int
+    ) -> None:
+        # the workers share the iterator, so each page is only fetched once, and
+        # pages are taken in order, so the page the consumer needs next is
+        # always taken before any a worker is waiting to fetch
+        for page in pages:
+            paginator = await Paginator.wait_for_room(reference, page)
+            if paginator is None:
+                return
+            if paginator.controller is not None:
+                await paginator.controller.acquire()
+            try:
+                data, paginator_info = await paginator.fetch_page_async(
+                    paginator.query.set_variables(__page=page)
+                )
+            finally:
+                if paginator.controller is not None:
+                    paginator.controller.release()
+                paginator.fetching -= 1
+            if page == last_page:
+                paginator.paginator_info = paginator_info
+            paginator.page_items = max(paginator.page_items, len(data))
+            paginator.deliver(page, data)
+            del paginator
+
+    def deliver(self, page: int, data: List[P]) -> None:
+        if self.ordered:
+            self.pages[page] = data
+            while self.next_page in self.pages:
+                self.enqueue(self.next_page, self.pages.pop(self.next_page))
+                self.next_page += 1
+        else:
+            self.enqueue(page, data)
+        if self.ready is not None:
+            self.ready.set()
+
+    def enqueue(self, page: int, data: List[P]) -> None:
+        for item in data:
+            self.queue.put_nowait(item)
+        if data:
+            self.queued_pages.append([page, len(data)])
+        else:
+            self.page_yielded(page)
+
+    def advance(self) -> None:
+        # the queue is first in first out, so the items of the first queued
+        # page are always yielded before any others
+        self.queued_pages[0][1] -= 1
+        if not self.queued_pages[0][1]:
+            self.page_yielded(self.queued_pages.popleft()[0])
+
+    def page_yielded(self, page: int) -> None:
+        self.yielded_pages.add(page)
+        completed_page = self.completed_page
+        # unordered pages can finish out of order, only pages with every
+        # page before them yielded count as completed
+        while self.completed_page + 1 in self.yielded_pages:
+            self.completed_page += 1
+            self.yielded_pages.remove(self.completed_page)
+        if self.completed_page != completed_page:
+            if self.drained is not None:
+                self.drained.set()
+            if self.sink is not None:
+                self.sink.save(self.checkpoint())
+
+    def checkpoint(self) -> PaginatorCheckpoint:
+        """Get the paginator's position, the last page with every page before it fully yielded, to resume from with :meth:`resume`, items already yielded from later pages when using unordered :meth:`parallel` are yielded again after resuming
+
+        Returns
+        -------
+        PaginatorCheckpoint
+            The checkpoint
+        """
+        return PaginatorCheckpoint(
+            self.completed_page,
+            self.checkpoint_hash(),
+            self.paginator_info and self.paginator_info.to_dict(),
+        )
+
+    def checkpoint_hash(self) -> str:
+        # the page is the position itself, any other variable changes what is paginated
+        variables = {
+            key: value
+            for key, value in self.query.variable_values.items()
+            if key != "__page"
+        }
+        key = json.dumps(
+            [self.query.compile().hash, variables], sort_keys=True, default=str
+        )
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def exhausted(self) -> None:
+        # a finished crawl starts over next time instead of resuming with nothing left
+        if self.sink is not None:
+            self.sink.clear()
+
+    def buffered(self) -> int:
+        """The number of fetched items waiting to be yielded"""
+        return self.queue.qsize() + sum(len(i) for i in self.pages.values())
+
+    def has_room(self, page: int) -> bool:
+        if page <= self.completed_page + 1:
+            # the consumer is waiting on this page, so it's never held up
+            return True
+        if self.max_items is None:
+            # only run a few pages ahead of the consumer, so the workers stop
+            # fetching when the paginator is abandoned
+            return page <= self.completed_page + 2 * (self.concurrency or 1)
+        if not self.page_items:
+            # the size of a page isn't known until the first one arrives
+            return False
+        return self.buffered() + self.fetching * self.page_items < self.max_items
+
+    @staticmethod
+    async def wait_for_room(
+        reference: weakref.ref[Paginator[Any]], page: int
+    ) -> Optional[Paginator[Any]]:
+        while True:
+            paginator = reference()
+            if paginator is None:
+                return None
+            if paginator.has_room(page):
+                paginator.fetching += 1
+                return paginator
+            if paginator.drained is None:
+                paginator.drained = asyncio.Event()
+            drained = paginator.drained
+            drained.clear()
+            # the paginator isn't held while waiting, so it can be collected
+            del paginator
+            await drained.wait()
+
+    def consumed(self) -> None:
+        self.advance()
+        if self.drained is not None:
+            self.drained.set()
+        if (
+            self.prefetch
+            and self.prefetch_task is None
+            and self.concurrency is None
+            and self.paginator_info is not None
+            and self.paginator_info.hasMorePages
+            and self.queue.qsize() <= self.page_items // 2
+        ):
+            # the next pages are fetched while the rest of the current one is used
+            self.prefetch_task = asyncio.create_task(
+                self.fetch_next_async(self.prefetch)
+            )
+            self.prefetch_task.add_done_callback(utils.retrieve_exception)
+
+    async def wait_fan_out(self) -> None:
+        task = self.fan_out_task
+        if task is None or self.ready is None:
+            return
+        while self.queue.empty() and not task.done():
+            self.ready.clear()
+            await self.ready.wait()
+        if self.queue.empty():
+            self.fan_out_task = None
+            # raises any error from fetching the pages
+            task.result()
+
+    def fetch_page(
+        self, query: Query[Result]
+    ) -> Tuple[List[Any], data_classes.PaginatorInfo]:
+        try:
+            return query.request(None, self.parse_result, query.deadline())
+        except errors.PersistedQueryNotFound:
+            query.hash = None
+            return query.request(None, self.parse_result, query.deadline())
+
+    async def fetch_page_async(
+        self, query: Query[Result]
+    ) -> Tuple[List[Any], data_classes.PaginatorInfo]:
+        if self.controller is None:
+            return await self.request_page_async(query)
+        started = time.monotonic()
+        try:
+            result = await self.request_page_async(query)
+        except Exception:
+            self.controller.shrink(started)
+            raise
+        self.controller.record(
+            started,
+            time.monotonic() - started,
+            query.rate_limit,
+            query.priority,
+            sum(i.throttled for i in self.kit.rate_limits()),
+        )
+        return result
+
+    async def request_page_async(
+        self, query: Query[Result]
+    ) -> Tuple[List[Any], data_classes.PaginatorInfo]:
+        try:
+            return await query.request_async(None, self.parse_result, query.deadline())
+        except errors.PersistedQueryNotFound:
+            query.hash = None
+            return await query.request_async(None, self.parse_result, query.deadline())
+
+    def resume(self, checkpoint: Optional[PaginatorCheckpoint], /) -> Self:
+        """Continue from the page after a checkpoint taken with :meth:`checkpoint`, must be called before the paginator is iterated
+
+        Parameters
+        ----------
+        checkpoint : Optional[PaginatorCheckpoint]
+            The checkpoint to resume from, the paginator is left as is if None
+
+        Returns
+        -------
+        Self
+            Returns the Paginator for use in method chaining
+
+        Raises
+        ------
+        CheckpointMismatch
+            The checkpoint was taken from a paginator with a different query or variables
+        """
+        if checkpoint is None:
+            return self
+        if checkpoint.hash != self.checkpoint_hash():
+            raise errors.CheckpointMismatch(
+                f"Checkpoint for query {checkpoint.hash} can't resume query {self.checkpoint_hash()}"
+            )
+        self.query.variable_values["__page"] = checkpoint.page
+        self.completed_page = checkpoint.page
+        self.next_page = checkpoint.page + 1
+        # the next page gets fresh paginator info unless the crawl had finished
+        self.paginator_info = (
+            data_classes.PaginatorInfo.from_data(checkpoint.paginator_info)  # type: ignore
+            if checkpoint.finished and checkpoint.paginator_info is not None
+            else None
+        )
+        return self
+
+    def checkpoint_to(self, sink: CheckpointSink, /) -> Self:
+        """Save a checkpoint to a sink each time every item of another page has been yielded, resuming from the checkpoint already in the sink if there is one, the sink is cleared once every item has been yielded so the next crawl starts over
+
+        Parameters
+        ----------
+        sink : CheckpointSink
+            The sink to save checkpoints to, such as a :class:`FileCheckpointSink`
+
+        Returns
+        -------
+        Self
+            Returns the Paginator for use in method chaining
+
+        Raises
+        ------
+        CheckpointMismatch
+            The sink has a checkpoint from a paginator with a different query or variables
+        """
+        self.resume(sink.load())
+        self.sink = sink
+        return self
 
     async def __anext__(self) -> P:
+        if self.closed:
+            raise StopAsyncIteration
         if self.queue.empty():
             await self.fill_async()
         try:
-            return self.queue.get_nowait()
+            item = self.queue.get_nowait()
         except asyncio.QueueEmpty as e:
+            self.exhausted()
             raise StopAsyncIteration from e
+        self.consumed()
+        return item
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Stop fetching pages in the background when iteration is stopped early, called automatically when the paginator is used in an ``async with`` block"""
+        self.closed = True
+        tasks = [i for i in (self.fan_out_task, self.prefetch_task) if i is not None]
+        self.fan_out_task = self.prefetch_task = None
+        for task in tasks:
+            task.cancel()
+        # errors from pages that are no longer wanted are ignored
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     def __await__(self) -> Generator[Any, None, None]:
         return self.fill_async().__await__()
 
+    def prioritize(self, priority: Priority, /) -> Self:
+        """Set the priority of the paginator's requests when waiting on the rate limit, by default Priority.BACKGROUND
+
+        Parameters
+        ----------
+        priority : Priority
+            The priority to use
+
+        Returns
+        -------
+        Self
+            Returns the Paginator for use in method chaining
+        """
+        self.query.priority = priority
+        return self
+
     def batch(self, size: int, /) -> Self:
         """Batch the queries used to fill the paginator, will run multiple queries simultaneously corresponding to the size provided, only works when using asynchronous iteration
 
@@ -1244,43 +2762,465 @@ class Paginator(Generic[P]):
         self.batch_size = size
         return self
 
+    def adaptive(self, controller: Optional[AdaptiveConcurrency] = None, /) -> Self:
+        """Adjust the number of pages fetched at once as the API's latency and the rate limit change, replacing the size given to :meth:`batch`, with :meth:`parallel` the concurrency given becomes the most pages fetched at once, only works when using asynchronous iteration
+
+        Parameters
+        ----------
+        controller : Optional[AdaptiveConcurrency], optional
+            The controller to adjust the number of pages with, by default a new :class:`AdaptiveConcurrency`
+
+        Returns
+        -------
+        Self
+            Returns the Paginator for use in method chaining
+        """
+        self.controller = controller or AdaptiveConcurrency()
+        return self
+
+    def buffer(self, max_items: Optional[int] = None, /, *, prefetch: int = 0) -> Self:
+        """Bound the number of fetched items waiting to be yielded and fetch pages before they are needed, only works when using asynchronous iteration
+
+        Parameters
+        ----------
+        max_items : Optional[int], optional
+            The number of waiting items, counting those on pages still being fetched, at which no more pages are requested until some are yielded, the page the next item comes from is always fetched even if it goes over, by default None
+        prefetch : int, optional
+            The number of pages to fetch in the background once half a page of items is left, by default 0
+
+        Returns
+        -------
+        Self
+            Returns the Paginator for use in method chaining
+        """
+        self.max_items = max_items
+        self.prefetch = prefetch
+        return self
+
+    def parallel(self, concurrency: int, /, *, ordered: bool = True) -> Self:
+        """Fetch every remaining page once the first page says how many there are, running up to ``concurrency`` requests at once through the rate limit and staying at most twice that many pages ahead of the items yielded unless :meth:`buffer` is used, only works when using asynchronous iteration
+
+        Parameters
+        ----------
+        concurrency : int
+            The maximum number of pages to fetch at once
+        ordered : bool, optional
+            Whether to yield items in page order, otherwise items are yielded as soon as their page arrives, by default True
+
+        Returns
+        -------
+        Self
+            Returns the Paginator for use in method chaining
+        """
+        self.concurrency = concurrency
+        self.ordered = ordered
+        return self
+
     def parse_result(
         self, text: str, status: int
     ) -> Tuple[List[Any], data_classes.PaginatorInfo]:
+        decoder = self.kit.decoder
         try:
-            response = self.kit.loads(text)
+            start = (
+                utils.find_json_array(text, ("data", self.endpoint, "data"), decoder)
+                if isinstance(decoder, IncrementalDecoder)
+                else None
+            )
+            if start is None or not isinstance(decoder, IncrementalDecoder):
+                # errors without data or a decoder that parses the whole page
+                # in one go, let the whole response be checked
+                data = None
+                response = self.kit.loads(text)
+            else:
+                # each item becomes a Data object before the next is decoded, so
+                # the full tree of dicts for the page is never held at once
+                data, end = utils.decode_json_array(
+                    text, start, decoder, utils.convert_data_item
+                )
+                response = self.kit.loads(f"{text[:start]}[]{text[end:]}")
         except json.JSONDecodeError as e:
             raise errors.InvalidResponse(text, status) from e
-        self.kit.check_response_for_errors(response)
+        self.query.check_response_for_errors(response)
+        # later pages can be sent as persisted queries now the API knows the hash
+        self.query.confirm_hash()
         # from_data returns Data, not PaginatorInfo
-        return utils.convert_data_array(  # type: ignore
-            response["data"][self.endpoint]["data"]
-        ), data_classes.PaginatorInfo.from_data(
+        return (
+            utils.convert_data_array(response["data"][self.endpoint]["data"])
+            if data is None
+            else data
+        ), data_classes.PaginatorInfo.from_data(  # type: ignore
             response["data"][self.endpoint]["paginatorInfo"]
         )
 
 
+class ShardedPaginator(Generic[P]):
+    """Represents a Paginator split into ranges of IDs, each paginated separately with items merged as they arrive and duplicate IDs dropped, designed for use in a ``for``/``async for`` loop"""
+
+    def __init__(self, paginators: List[Paginator[P]]) -> None:
+        self.paginators: List[Paginator[P]] = paginators
+        self.concurrency: int = len(paginators)
+        self.max_items: int = 0
+        self.seen: Set[Any] = set()
+        self.index: int = 0
+        self.queue: Optional[asyncio.Queue[P]] = None
+        self.ready: Optional[asyncio.Event] = None
+        self.drained: Optional[asyncio.Event] = None
+        self.task: Optional[asyncio.Task[None]] = None
+        self.closed: bool = False
+
+    @classmethod
+    def from_query(
+        cls, query: Query[Any], name: str, max_id: int, shards: int, min_id: int
+    ) -> Self:
+        if shards < 1:
+            raise ValueError(f"Can't split a field into {shards} shards")
+        if max_id < min_id:
+            raise ValueError(f"max_id {max_id} is lower than min_id {min_id}")
+        paginator = Paginator[P].from_query(query, name)
+        field = paginator.query.fields[0]
+        for argument in ("min_id", "max_id"):
+            variable = Variable(f"__{argument}", VariableType.INT)
+            field.arguments[argument] = variable
+            paginator.query.variables[variable.name] = variable
+        size = -(-(max_id - min_id + 1) // shards)
+        # every shard shares the query text and only sets different variables
+        return cls(
+            [
+                Paginator(
+                    query.kit,
+                    paginator.query.set_variables(
+                        __min_id=start, __max_id=min(start + size - 1, max_id)
+                    ),
+                )
+                for start in range(min_id, max_id + 1, size)
+            ]
+        )
+
+    def __iter__(self) -> Self:
+        return self
+
+    def __aiter__(self) -> Self:
+        return self
+
+    def __next__(self) -> P:
+        while self.index < len(self.paginators):
+            for item in self.paginators[self.index]:
+                if self.is_new(item):
+                    return item
+            self.index += 1
+        raise StopIteration
+
+    async def __anext__(self) -> P:
+        if self.closed:
+            raise StopAsyncIteration
+        if self.task is None:
+            self.queue = asyncio.Queue()
+            self.ready = asyncio.Event()
+            self.drained = asyncio.Event()
+            self.task = asyncio.create_task(
+                self.run(
+                    weakref.ref(self),
+                    self.ready,
+                    self.paginators,
+                    min(self.concurrency, len(self.paginators)),
+                )
+            )
+            self.task.add_done_callback(utils.retrieve_exception)
+            # the workers only hold the sharded paginator while merging items, so
+            # an abandoned one is collected and its crawl cancelled
+            weakref.finalize(self, self.task.cancel)
+        assert self.queue is not None and self.ready is not None
+        while self.queue.empty() and not self.task.done():
+            self.ready.clear()
+            await self.ready.wait()
+        if self.queue.empty():
+            # raises any error from crawling the shards
+            self.task.result()
+            raise StopAsyncIteration
+        item = self.queue.get_nowait()
+        if self.drained is not None:
+            self.drained.set()
+        return item
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Stop crawling the shards when iteration is stopped early, called automatically when the sharded paginator is used in an ``async with`` block"""
+        self.closed = True
+        task = self.task
+        self.task = None
+        if task is not None:
+            task.cancel()
+            # errors from shards that are no longer wanted are ignored
+            await asyncio.gather(task, return_exceptions=True)
+        for paginator in self.paginators:
+            await paginator.aclose()
+
+    def is_new(self, item: P) -> bool:
+        # rows shifting between pages while a shard is paginated can show up twice
+        id = getattr(item, "id", None)
+        if id is None:
+            return True
+        if id in self.seen:
+            return False
+        self.seen.add(id)
+        return True
+
+    def merge(self, item: P) -> None:
+        assert self.queue is not None and self.ready is not None
+        if self.is_new(item):
+            self.queue.put_nowait(item)
+            self.ready.set()
+
+    @staticmethod
+    async def run(
+        reference: weakref.ref[ShardedPaginator[Any]],
+        ready: asyncio.Event,
+        paginators: List[Paginator[Any]],
+        concurrency: int,
+    ) -> None:
+        shards = iter(paginators)
+        workers = [
+            asyncio.create_task(ShardedPaginator.crawl(reference, shards))
+            for _ in range(concurrency)
+        ]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            ready.set()
+
+    @staticmethod
+    async def crawl(
+        reference: weakref.ref[ShardedPaginator[Any]],
+        paginators: Iterator[Paginator[Any]],
+    ) -> None:
+        # the workers share the iterator, so each shard is only crawled once
+        for paginator in paginators:
+            async for item in paginator:
+                sharded = reference()
+                if sharded is None:
+                    return
+                sharded.merge(item)
+                del sharded
+                # the next item fetches another page
+                if paginator.queue.empty() and not await ShardedPaginator.wait_for_room(
+                    reference, paginator
+                ):
+                    return
+
+    @staticmethod
+    async def wait_for_room(
+        reference: weakref.ref[ShardedPaginator[Any]], paginator: Paginator[Any]
+    ) -> bool:
+        while True:
+            sharded = reference()
+            if sharded is None:
+                return False
+            assert sharded.queue is not None and sharded.drained is not None
+            # by default each shard being crawled keeps about a page waiting, so
+            # the shards stop fetching when the sharded paginator is abandoned
+            max_items = sharded.max_items or max(paginator.page_items, 1) * min(
+                sharded.concurrency, len(sharded.paginators)
+            )
+            if sharded.queue.qsize() < max_items:
+                return True
+            drained = sharded.drained
+            drained.clear()
+            # the sharded paginator isn't held while waiting, so it can be collected
+            del sharded
+            await drained.wait()
+
+    def parallel(self, concurrency: int, /) -> Self:
+        """Set the number of shards to paginate at once, by default every shard, only works when using asynchronous iteration
+
+        Parameters
+        ----------
+        concurrency : int
+            The maximum number of shards to paginate at once
+
+        Returns
+        -------
+        Self
+            Returns the ShardedPaginator for use in method chaining
+        """
+        self.concurrency = concurrency
+        return self
+
+    def buffer(self, max_items: int, /) -> Self:
+        """Bound the number of merged items waiting to be yielded, by default about a page for each shard being crawled, shards stop fetching pages while it is full, only works when using asynchronous iteration
+
+        Parameters
+        ----------
+        max_items : int
+            The number of waiting items at which shards wait for items to be yielded
+
+        Returns
+        -------
+        Self
+            Returns the ShardedPaginator for use in method chaining
+        """
+        self.max_items = max_items
+        return self
+
+    def partition(self, index: int, count: int, /) -> Self:
+        """Get the share of the shards for one of several workers crawling the same field, each worker gets every ``count`` th shard starting from ``index``
+
+        Parameters
+        ----------
+        index : int
+            The index of the worker, starting from 0
+        count : int
+            The number of workers
+
+        Returns
+        -------
+        Self
+            A ShardedPaginator for the worker's shards
+        """
+        partition = type(self)(self.paginators[index::count])
+        partition.concurrency = self.concurrency
+        partition.max_items = self.max_items
+        return partition
+
+
+class Loader(Generic[T]):
+    """Represents a Loader for use in fetching many items by ID, lookups made in the same event loop iteration are combined into a single query"""
+
+    def __init__(
+        self,
+        kit: QueryKit,
+        field: str,
+        *fields: FieldValue,
+        arguments: Optional[Dict[str, Union[Argument, Sequence[Argument]]]] = None,
+        max_ids: int = 500,
+    ) -> None:
+        self.kit: QueryKit = kit
+        self.field: str = field
+        self.fields: Tuple[FieldValue, ...] = ("id", *fields)
+        self.arguments: Dict[str, Union[Argument, Sequence[Argument]]] = arguments or {}
+        self.max_ids: int = max_ids
+        self.pending: Dict[int, List[asyncio.Future[Optional[T]]]] = {}
+        self.handle: Optional[asyncio.Handle] = None
+
+    async def load(self, id: int) -> Optional[T]:
+        """Load a single item by ID
+
+        Parameters
+        ----------
+        id : int
+            The ID of the item to load
+
+        Returns
+        -------
+        Optional[T]
+            The item, or None if no item exists with the ID provided
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Optional[T]] = loop.create_future()
+        self.pending.setdefault(int(id), []).append(future)
+        if self.handle is None:
+            self.handle = loop.call_soon(self.dispatch)
+        return await future
+
+    async def load_many(self, ids: Iterable[int]) -> List[Optional[T]]:
+        """Load many items by ID
+
+        Parameters
+        ----------
+        ids : Iterable[int]
+            The IDs of the items to load
+
+        Returns
+        -------
+        List[Optional[T]]
+            The items in the same order as the IDs provided, None for any ID that has no item
+        """
+        return list(await asyncio.gather(*(self.load(i) for i in ids)))
+
+    def dispatch(self) -> None:
+        self.handle = None
+        pending, self.pending = self.pending, {}
+        ids = list(pending)
+        for index in range(0, len(ids), self.max_ids):
+            asyncio.create_task(
+                self.run({i: pending[i] for i in ids[index : index + self.max_ids]})
+            )
+
+    async def run(self, pending: Dict[int, List[asyncio.Future[Optional[T]]]]) -> None:
+        logger.debug("Loading %s %s", len(pending), self.field)
+        query = self.kit.query(
+            self.field,  # type: ignore
+            {**self.arguments, "id": list(pending), "first": self.max_ids},
+            *self.fields,
+        )
+        try:
+            result = await query.get_async()
+        except BaseException as e:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        data: List[Any] = getattr(result, self.field) or []
+        items: Dict[int, Optional[T]] = {int(i.id): i for i in data}
+        for id, futures in pending.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(items.get(id))
+
+
 class Mutation(Query[R]):
     """Supports all methods of :class:`Query` where applicable"""
 
     ROOT: ClassVar[str] = "mutation"
+    PRIORITY: ClassVar[Priority] = Priority.MUTATION
+
+    @property
+    def rate_limit(self) -> RateLimit:
+        return self.kit.bot_rate_limit
 
-    def get(self, headers: Optional[Dict[str, Any]] = None) -> R:
+    def get(
+        self,
+        headers: Optional[Dict[str, Any]] = None,
+        *,
+        cache: bool = True,
+        refresh: bool = False,
+        timeout: Optional[float] = None,
+    ) -> R:
         mutation_headers = {
             "X-Api-Key": self.kit.bot_key_api_key,
             "X-Bot-Key": self.kit.bot_key,
         }
         return super().get(
-            {**headers, **mutation_headers} if headers else mutation_headers
+            {**headers, **mutation_headers} if headers else mutation_headers,
+            cache=cache,
+            refresh=refresh,
+            timeout=timeout,
         )
 
-    async def get_async(self, headers: Optional[Dict[str, Any]] = None) -> R:
+    async def get_async(
+        self,
+        headers: Optional[Dict[str, Any]] = None,
+        *,
+        cache: bool = True,
+        refresh: bool = False,
+        timeout: Optional[float] = None,
+    ) -> R:
         mutation_headers = {
             "X-Api-Key": self.kit.bot_key_api_key,
             "X-Bot-Key": self.kit.bot_key,
         }
         return await super().get_async(
-            {**headers, **mutation_headers} if headers else mutation_headers
+            {**headers, **mutation_headers} if headers else mutation_headers,
+            cache=cache,
+            refresh=refresh,
+            timeout=timeout,
         )
 
 
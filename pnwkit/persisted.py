@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import tempfile
+import threading
+from typing import TYPE_CHECKING
+
+__all__ = ("PersistedQueryRegistry",)
+
+if TYPE_CHECKING:
+    from typing import Optional, Set, Tuple
+
+
+class PersistedQueryRegistry:
+    def __init__(self, path: Optional[str] = None) -> None:
+        """A record of the query hashes the API has confirmed for Automatic Persisted Queries, kept in a SQLite database so new processes can send known queries by hash from their first request
+
+        Parameters
+        ----------
+        path : Optional[str], optional
+            The path of the database file, by default ``pnwkit-persisted-queries.sqlite3`` in the temporary directory
+        """
+        self.path: str = path or os.path.join(
+            tempfile.gettempdir(), "pnwkit-persisted-queries.sqlite3"
+        )
+        self.lock: threading.Lock = threading.Lock()
+        self.connection: sqlite3.Connection = sqlite3.connect(
+            self.path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS persisted_queries (url TEXT NOT NULL, hash TEXT NOT NULL, PRIMARY KEY (url, hash))"
+        )
+        self.hashes: Set[Tuple[str, str]] = set()
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def load(self) -> None:
+        """Load the confirmed hashes from the database, including those confirmed by other processes since the registry was created"""
+        with self.lock:
+            self.hashes = set(
+                self.connection.execute("SELECT url, hash FROM persisted_queries")
+            )
+
+    def confirmed(self, url: str, hash: str) -> bool:
+        """Whether the API at a URL is known to have a query's hash
+
+        Parameters
+        ----------
+        url : str
+            The GraphQL URL of the API
+        hash : str
+            The sha256 hash of the query
+
+        Returns
+        -------
+        bool
+            Whether the query can be sent by its hash
+        """
+        return (url, hash) in self.hashes
+
+    def confirm(self, url: str, hash: str) -> None:
+        if (url, hash) in self.hashes:
+            return
+        with self.lock:
+            self.hashes.add((url, hash))
+            self.connection.execute(
+                "INSERT OR IGNORE INTO persisted_queries (url, hash) VALUES (?, ?)",
+                (url, hash),
+            )
+
+    def invalidate(self, url: str, hash: str) -> None:
+        with self.lock:
+            self.hashes.discard((url, hash))
+            self.connection.execute(
+                "DELETE FROM persisted_queries WHERE url = ? AND hash = ?",
+                (url, hash),
+            )
+
+    def clear(self) -> None:
+        """Forget every confirmed hash"""
+        with self.lock:
+            self.hashes.clear()
+            self.connection.execute("DELETE FROM persisted_queries")
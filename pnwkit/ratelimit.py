@@ -1,25 +1,222 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import datetime
+import enum
+import hashlib
+import heapq
+import itertools
+import logging
+import math
+import os
+import sqlite3
+import tempfile
+import threading
 import time
 from typing import TYPE_CHECKING
 
-from . import utils
+from . import errors, utils
 
-__all__ = ("RATE_LIMITS", "RateLimit")
+__all__ = (
+    "RATE_LIMITS",
+    "RateLimit",
+    "SharedRateLimit",
+    "Priority",
+    "KeyPool",
+    "DailyBudget",
+)
 
 if TYPE_CHECKING:
-    from typing import Any, Dict, Optional
+    from typing import (
+        Any,
+        Dict,
+        Generator,
+        Iterator,
+        List,
+        Optional,
+        Sequence,
+        Tuple,
+    )
 
-RATE_LIMITS: Dict[str, RateLimit] = {}
+logger = logging.getLogger(__name__)
+
+RATE_LIMITS: Dict[Tuple[str, Optional[str]], RateLimit] = {}
+
+
+class Priority(enum.IntEnum):
+    """The order requests sharing a rate limit are let through in, lower values go first"""
+
+    INTERACTIVE = 0
+    MUTATION = 1
+    BACKGROUND = 2
+    BULK = 3
+
+
+class DailyBudget:
+    def __init__(
+        self,
+        max_requests: Optional[int] = None,
+        *,
+        reserve: float = 0.1,
+        reconcile_interval: float = 600,
+    ) -> None:
+        """Tracks a key's daily requests against its daily maximum and paces background requests so the maximum lasts the whole day
+
+        Parameters
+        ----------
+        max_requests : Optional[int], optional
+            The number of requests the key can make per day, by default None (learnt from the API)
+        reserve : float, optional
+            The share of the daily maximum background requests are paced to leave for other requests, by default 0.1
+        reconcile_interval : float, optional
+            The number of seconds between checking the request count against the API, by default 600
+        """
+        self.max_requests: Optional[int] = max_requests
+        self.reserve: float = reserve
+        self.reconcile_interval: float = reconcile_interval
+        self.requests: int = 0
+        self.paced_until: float = 0
+        self.day: datetime.date = self.today()
+        self.reconciled_at: float = -math.inf
+        self.reconciling: bool = False
+
+    @staticmethod
+    def today() -> datetime.date:
+        return datetime.datetime.now(datetime.timezone.utc).date()
+
+    @staticmethod
+    def elapsed() -> float:
+        """The number of seconds since the day started"""
+        now = datetime.datetime.now(datetime.timezone.utc)
+        return (
+            now - now.replace(hour=0, minute=0, second=0, microsecond=0)
+        ).total_seconds()
+
+    def rollover(self) -> None:
+        today = self.today()
+        if today != self.day:
+            self.day = today
+            self.requests = 0
+            self.paced_until = 0
+
+    def record(self) -> None:
+        self.rollover()
+        self.requests += 1
+
+    @property
+    def needs_reconcile(self) -> bool:
+        return (
+            not self.reconciling
+            and time.monotonic() - self.reconciled_at >= self.reconcile_interval
+        )
+
+    def reconcile(self, requests: int, max_requests: int) -> None:
+        """Update the budget with the counts reported by the API
+
+        Parameters
+        ----------
+        requests : int
+            The number of requests the key has made today
+        max_requests : int
+            The number of requests the key can make per day
+        """
+        self.rollover()
+        self.requests = requests
+        self.max_requests = max_requests
+        self.reconciled_at = time.monotonic()
+
+    def pace(self, priority: int) -> float:
+        """Get the number of seconds a request should wait to stay on pace for the day
+
+        Parameters
+        ----------
+        priority : int
+            The :class:`Priority` of the request, only background and bulk requests are paced
+
+        Returns
+        -------
+        float
+            The number of seconds to wait
+        """
+        return self.next_slot(priority, False)
+
+    def schedule(self, priority: int) -> float:
+        """Take the next request slot on pace for the day and get the number of seconds to wait for it, concurrent requests take consecutive slots instead of all waiting the same time
+
+        Parameters
+        ----------
+        priority : int
+            The :class:`Priority` of the request, only background and bulk requests are paced
+
+        Returns
+        -------
+        float
+            The number of seconds to wait
+        """
+        return self.next_slot(priority, True)
+
+    def next_slot(self, priority: int, take: bool) -> float:
+        if priority < Priority.BACKGROUND or not self.max_requests:
+            return 0
+        self.rollover()
+        allowance = self.max_requests * (1 - self.reserve) / 86400
+        if allowance <= 0:
+            return 86400 - self.elapsed()
+        # requests are only recorded once sent, so slots already taken by
+        # requests still waiting are counted separately
+        slot = max((self.requests + 1) / allowance, self.paced_until + 1 / allowance)
+        if take:
+            self.paced_until = slot
+        return max(slot - self.elapsed(), 0)
+
+    def projected_exhaustion(self) -> Optional[datetime.timedelta]:
+        """Get how long until the daily maximum is reached at today's rate
+
+        Returns
+        -------
+        Optional[datetime.timedelta]
+            The time until the maximum is reached, or None if the maximum is unknown or no requests have been made
+        """
+        self.rollover()
+        elapsed = self.elapsed()
+        if not self.max_requests or not self.requests or elapsed <= 0:
+            return None
+        rate = self.requests / elapsed
+        return datetime.timedelta(
+            seconds=max(self.max_requests - self.requests, 0) / rate
+        )
+
+    def state(self) -> Dict[str, Any]:
+        exhaustion = self.projected_exhaustion()
+        return {
+            "requests": self.requests,
+            "max_requests": self.max_requests,
+            "projected_exhaustion": None
+            if exhaustion is None
+            else exhaustion.total_seconds(),
+        }
 
 
 class RateLimit:
-    def __init__(self, url: str) -> None:
+    def __init__(self, url: str, key: Optional[str] = None) -> None:
         self.url: str = url
+        self.key: Optional[str] = key
         self.limit: Optional[int] = None
         self.remaining: Optional[int] = None
-        self.reset: Optional[int] = None
+        # the reset time is kept on the monotonic clock
+        self.reset: Optional[float] = None
         self.interval: Optional[int] = None
+        self.pending: int = 0
+        self.drift: int = 0
+        self.skew: float = 0
+        self.waiters: List[Tuple[int, int, asyncio.Future[None]]] = []
+        self.counter: Iterator[int] = itertools.count()
+        self.reservations: Dict[int, float] = {}
+        self.timer: Optional[asyncio.TimerHandle] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.budget: Optional[DailyBudget] = None
+        self.throttled: int = 0
 
     @property
     def initialized(self) -> bool:
@@ -31,40 +228,454 @@ class RateLimit:
         )
 
     def initialize(self, headers: Any) -> None:
-        self.limit = utils.get_int_or_none(headers.get("X-RateLimit-Limit"))
-        self.remaining = utils.get_int_or_none(headers.get("X-RateLimit-Remaining"))
-        self.reset = utils.get_int_or_none(headers.get("X-RateLimit-Reset"))
-        self.interval = utils.get_int_or_none(headers.get("X-RateLimit-Interval"))
+        self.update(headers)
+
+    def update(self, headers: Any) -> None:
+        """Reconcile the rate limit with the headers of a response
+
+        Parameters
+        ----------
+        headers : Any
+            The headers of the response
+        """
+        self.pending = max(self.pending - 1, 0)
+        limit = utils.get_int_or_none(headers.get("X-RateLimit-Limit"))
+        remaining = utils.get_int_or_none(headers.get("X-RateLimit-Remaining"))
+        reset = utils.get_int_or_none(headers.get("X-RateLimit-Reset"))
+        interval = utils.get_int_or_none(headers.get("X-RateLimit-Interval"))
+        if limit is None or remaining is None or reset is None or interval is None:
+            return
+        reset_at = self.to_monotonic(reset)
+        # requests sent after this one have not been counted by the server yet
+        expected = remaining - self.pending
+        if (
+            self.remaining is not None
+            and self.reset is not None
+            and abs(reset_at - self.reset) < interval / 2
+        ):
+            self.drift = self.remaining - expected
+            self.skew = reset_at - self.reset
+            self.remaining = max(min(self.remaining, expected), 0)
+        else:
+            self.remaining = max(expected, 0)
+        self.limit = limit
+        self.reset = reset_at
+        self.interval = interval
 
-    def hit(self) -> int:
+    def reserve(self, priority: Priority, share: float) -> None:
+        """Reserve a share of each window for requests of a priority or higher, requests of a lower priority will wait rather than use it
+
+        Parameters
+        ----------
+        priority : Priority
+            The priority to reserve the share for
+        share : float
+            The share of the limit to reserve, between 0 and 1, 0 removes the reservation
+        """
+        if share > 0:
+            self.reservations[priority] = share
+        else:
+            self.reservations.pop(priority, None)
+
+    def reserved(self, priority: int) -> int:
+        if self.limit is None:
+            return 0
+        return math.floor(
+            self.limit
+            * sum(share for key, share in self.reservations.items() if key < priority)
+        )
+
+    def hit(self, priority: int = Priority.INTERACTIVE) -> float:
         if (
             self.limit is None
             or self.remaining is None
             or self.reset is None
             or self.interval is None
         ):
+            self.pending += 1
+            self.spend()
             return 0
-        current_time = int(time.time())
-        if current_time > self.reset:
-            self.remaining = self.limit - 1
-            self.reset = int(current_time + 1 + self.interval)
-            return 0
+        now = time.monotonic()
+        if now >= self.reset:
+            self.remaining = self.limit
+            self.reset = now + self.interval
+            self.pending = 0
+        if self.remaining <= self.reserved(priority):
+            return self.reset - now
         self.remaining -= 1
-        if self.remaining <= 0:
-            return int(self.reset - current_time) + 1
+        self.pending += 1
+        self.spend()
         return 0
 
+    def wait_time(self, priority: int = Priority.INTERACTIVE) -> float:
+        """Estimate how long a request would wait for a permit without taking one
+
+        Parameters
+        ----------
+        priority : int, optional
+            The :class:`Priority` of the request, by default Priority.INTERACTIVE
+
+        Returns
+        -------
+        float
+            The estimated number of seconds until the request would be let through
+        """
+        if (
+            self.limit is None
+            or self.remaining is None
+            or self.reset is None
+            or self.interval is None
+        ):
+            return 0
+        now = time.monotonic()
+        if now >= self.reset:
+            return 0
+        reserved = self.reserved(priority)
+        # requests queued at the same or a higher priority go first
+        ahead = sum(1 for i in self.waiters if i[0] <= priority and not i[2].done())
+        available = self.remaining - reserved
+        if ahead < available:
+            return 0
+        windows = (ahead - available) // max(self.limit - reserved, 1)
+        return self.reset - now + windows * self.interval
+
+    def spend(self) -> None:
+        if self.budget is not None:
+            self.budget.record()
+
+    async def acquire(self, priority: int = Priority.INTERACTIVE) -> None:
+        """Wait for a request to be allowed, waiting requests are let through by priority then in the order they arrived from a single timer
+
+        Parameters
+        ----------
+        priority : int, optional
+            The :class:`Priority` of the request, by default Priority.INTERACTIVE
+        """
+        loop = asyncio.get_running_loop()
+        if self.loop is not loop:
+            # waiters and timers from a previous event loop will never be woken
+            self.loop = loop
+            self.waiters.clear()
+            self.timer = None
+        if not self.waiters and self.hit(priority) <= 0:
+            return
+        future: asyncio.Future[None] = loop.create_future()
+        heapq.heappush(self.waiters, (priority, next(self.counter), future))
+        # a higher priority request may be able to use a reserved permit now
+        if self.timer is not None:
+            self.timer.cancel()
+        self.wake()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # the permit was handed over after being cancelled, give it back
+                self.release()
+            raise
+
+    def wake(self) -> None:
+        self.timer = None
+        while self.waiters:
+            priority, _, future = self.waiters[0]
+            if future.done():
+                heapq.heappop(self.waiters)
+                continue
+            wait = self.hit(priority)
+            if wait > 0:
+                if self.loop is not None:
+                    self.timer = self.loop.call_later(wait, self.wake)
+                return
+            heapq.heappop(self.waiters)
+            future.set_result(None)
+
+    def release(self) -> None:
+        self.restore()
+        if self.waiters and self.timer is not None:
+            self.timer.cancel()
+            self.wake()
+
+    def restore(self) -> None:
+        if self.remaining is not None:
+            self.remaining += 1
+        self.pending = max(self.pending - 1, 0)
+
+    def abandon(self) -> None:
+        """Stop counting a request that failed before receiving a response as awaiting one, its permit isn't given back as the server may have counted it"""
+        self.pending = max(self.pending - 1, 0)
+
+    @staticmethod
+    def to_monotonic(timestamp: float) -> float:
+        return time.monotonic() + timestamp - time.time()
+
+    @classmethod
+    def get(cls, url: str, key: Optional[str] = None) -> RateLimit:
+        if (url, key) not in RATE_LIMITS:
+            RATE_LIMITS[url, key] = cls(url, key)
+        return RATE_LIMITS[url, key]
+
     @classmethod
-    def get(cls, url: str) -> RateLimit:
-        if url not in RATE_LIMITS:
-            RATE_LIMITS[url] = cls(url)
-        return RATE_LIMITS[url]
+    def states(cls) -> List[Dict[str, Any]]:
+        """Get the state of every rate limit in use
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            The state of each rate limit, see :meth:`RateLimit.state`
+        """
+        return [i.state() for i in RATE_LIMITS.values()]
+
+    def state(self) -> Dict[str, Any]:
+        """Get the state of the rate limit, the key is masked to its last four characters
+
+        Returns
+        -------
+        Dict[str, Any]
+            The URL, key, limit, remaining requests, seconds until reset, interval, requests awaiting a response, daily budget, and the drift in requests and seconds measured against the server at the last response
+        """
+        return {
+            "url": self.url,
+            "key": None if self.key is None else f"...{self.key[-4:]}",
+            "limit": self.limit,
+            "remaining": self.remaining,
+            "reset": None if self.reset is None else self.reset - time.monotonic(),
+            "interval": self.interval,
+            "pending": self.pending,
+            "budget": None if self.budget is None else self.budget.state(),
+            "drift": self.drift,
+            "skew": self.skew,
+        }
 
     def handle_429(self, reset: Optional[str]) -> Optional[float]:
+        self.throttled += 1
         self.remaining = 0
+        timestamp = utils.get_int_or_none(reset)
         self.reset = (
-            utils.get_int_or_none(reset)
-            or self.reset
-            or int(time.time() + (self.interval or 60))
+            self.to_monotonic(timestamp)
+            if timestamp is not None
+            else self.reset or time.monotonic() + (self.interval or 60)
+        )
+        return max(self.reset - time.monotonic(), 0)
+
+
+class SharedRateLimit(RateLimit):
+    def __init__(
+        self,
+        url: str,
+        key: Optional[str] = None,
+        path: Optional[str] = None,
+        *,
+        timeout: float = 0.1,
+    ) -> None:
+        """A rate limit with its state kept in a SQLite database so it can be shared by multiple processes on the same host
+
+        Parameters
+        ----------
+        url : str
+            The URL the rate limit applies to
+        key : Optional[str], optional
+            The key the rate limit applies to, it is stored hashed, by default None
+        path : Optional[str], optional
+            The path of the database file, by default ``pnwkit-ratelimit.sqlite3`` in the temporary directory
+        timeout : float, optional
+            The number of seconds to wait for another process to release the database before telling the request to try again after as long, kept short as the wait blocks the event loop, by default 0.1
+        """
+        super().__init__(url, key)
+        self.path: str = path or os.path.join(
+            tempfile.gettempdir(), "pnwkit-ratelimit.sqlite3"
+        )
+        self.id: str = hashlib.sha256((key or "").encode("utf-8")).hexdigest()
+        self.lock: threading.Lock = threading.Lock()
+        self.timeout: float = timeout
+        self.connection: sqlite3.Connection = sqlite3.connect(
+            self.path, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        # readers don't wait on writers in WAL mode
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limits (url TEXT NOT NULL, key TEXT NOT NULL, rate_limit INTEGER NOT NULL, remaining INTEGER NOT NULL, reset REAL NOT NULL, interval INTEGER NOT NULL, PRIMARY KEY (url, key))"
+        )
+
+    @classmethod
+    def get(
+        cls, url: str, key: Optional[str] = None, path: Optional[str] = None
+    ) -> RateLimit:
+        rate_limit = RATE_LIMITS.get((url, key))
+        if (
+            not isinstance(rate_limit, SharedRateLimit)
+            or path is not None
+            and rate_limit.path != path
+        ):
+            rate_limit = RATE_LIMITS[url, key] = cls(url, key, path)
+        return rate_limit
+
+    @contextlib.contextmanager
+    def transaction(self) -> Generator[bool, None, None]:
+        with self.lock:
+            # IMMEDIATE takes the write lock up front so other processes wait their turn
+            try:
+                self.connection.execute("BEGIN IMMEDIATE")
+            except sqlite3.OperationalError as e:
+                logger.debug("Rate limit database is busy: %s", e)
+                yield False
+                return
+            try:
+                self.load()
+                yield True
+                self.save()
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+            self.connection.execute("COMMIT")
+
+    def load(self) -> None:
+        row = self.connection.execute(
+            "SELECT rate_limit, remaining, reset, interval FROM rate_limits WHERE url = ? AND key = ?",
+            (self.url, self.id),
+        ).fetchone()
+        if row is not None:
+            self.limit, self.remaining, reset, self.interval = row
+            self.reset = self.to_monotonic(reset)
+
+    def save(self) -> None:
+        if (
+            self.limit is None
+            or self.remaining is None
+            or self.reset is None
+            or self.interval is None
+        ):
+            return
+        self.connection.execute(
+            "INSERT OR REPLACE INTO rate_limits (url, key, rate_limit, remaining, reset, interval) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                self.url,
+                self.id,
+                self.limit,
+                self.remaining,
+                time.time() + self.reset - time.monotonic(),
+                self.interval,
+            ),
         )
-        return self.interval if self.reset is None else self.reset - time.time()
+
+    def update(self, headers: Any) -> None:
+        with self.transaction():
+            super().update(headers)
+
+    def hit(self, priority: int = Priority.INTERACTIVE) -> float:
+        with self.transaction() as locked:
+            if not locked:
+                # this process's own state doesn't count other processes' requests
+                return self.timeout
+            return super().hit(priority)
+
+    def refresh(self) -> None:
+        """Load the state other processes have saved without taking the write lock"""
+        with self.lock:
+            try:
+                self.load()
+            except sqlite3.OperationalError as e:
+                logger.debug("Using local rate limit state, database is busy: %s", e)
+
+    def wait_time(self, priority: int = Priority.INTERACTIVE) -> float:
+        self.refresh()
+        return super().wait_time(priority)
+
+    def restore(self) -> None:
+        with self.transaction():
+            super().restore()
+
+    def handle_429(self, reset: Optional[str]) -> Optional[float]:
+        with self.transaction():
+            return super().handle_429(reset)
+
+    def state(self) -> Dict[str, Any]:
+        self.refresh()
+        return {**super().state(), "path": self.path}
+
+
+class PooledKey:
+    __slots__ = ("key", "rate_limit", "throttled", "disabled_until", "removed")
+
+    def __init__(self, key: str, rate_limit: RateLimit) -> None:
+        self.key: str = key
+        self.rate_limit: RateLimit = rate_limit
+        self.throttled: int = 0
+        self.disabled_until: float = 0
+        self.removed: bool = False
+
+    @property
+    def available(self) -> float:
+        if self.rate_limit.remaining is None:
+            # nothing is known about an unused key, so try it first
+            return math.inf
+        return self.rate_limit.remaining
+
+
+class KeyPool:
+    def __init__(
+        self,
+        keys: Sequence[PooledKey],
+        *,
+        max_throttled: int = 3,
+        cooldown: float = 300,
+    ) -> None:
+        """A pool of API keys that read only queries are spread across
+
+        Parameters
+        ----------
+        keys : Sequence[PooledKey]
+            The keys in the pool with their rate limits
+        max_throttled : int, optional
+            The number of consecutive 429 responses after which a key is taken out of rotation, by default 3
+        cooldown : float, optional
+            The number of seconds a throttled key is taken out of rotation for, by default 300
+        """
+        self.keys: List[PooledKey] = list(keys)
+        self.max_throttled: int = max_throttled
+        self.cooldown: float = cooldown
+
+    def select(self) -> PooledKey:
+        """Get the key with the most remaining requests
+
+        Returns
+        -------
+        PooledKey
+            The selected key, throttled keys are only returned when every key is throttled
+        """
+        keys = [i for i in self.keys if not i.removed]
+        if not keys:
+            raise errors.NoKeysAvailable("Every key in the pool has been removed")
+        now = time.monotonic()
+        enabled = [i for i in keys if i.disabled_until <= now]
+        if not enabled:
+            return min(keys, key=lambda i: i.disabled_until)
+        return max(enabled, key=lambda i: i.available)
+
+    def succeeded(self, key: PooledKey) -> None:
+        key.throttled = 0
+
+    def throttle(self, key: PooledKey) -> None:
+        key.throttled += 1
+        if key.throttled >= self.max_throttled:
+            key.disabled_until = time.monotonic() + self.cooldown
+            key.throttled = 0
+
+    def remove(self, key: PooledKey) -> None:
+        key.removed = True
+
+    def states(self) -> List[Dict[str, Any]]:
+        """Get the state of each key in the pool
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            The state of each key's rate limit, along with whether it is removed and how long it is out of rotation for
+        """
+        now = time.monotonic()
+        return [
+            {
+                **i.rate_limit.state(),
+                "removed": i.removed,
+                "disabled": max(i.disabled_until - now, 0),
+            }
+            for i in self.keys
+        ]
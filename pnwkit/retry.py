@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+from typing import TYPE_CHECKING
+
+import aiohttp
+import requests
+
+from . import errors
+
+__all__ = ("RetryPolicy",)
+
+if TYPE_CHECKING:
+    from typing import Iterable, Optional, Set, Tuple, Type
+
+
+class RetryPolicy:
+    EXCEPTIONS: Tuple[Type[BaseException], ...] = (
+        aiohttp.ClientConnectionError,
+        aiohttp.ClientPayloadError,
+        asyncio.TimeoutError,
+        ConnectionError,
+        requests.ConnectionError,
+        requests.Timeout,
+        requests.exceptions.ChunkedEncodingError,
+    )
+
+    def __init__(
+        self,
+        retries: int = 3,
+        *,
+        base: float = 0.5,
+        cap: float = 30,
+        budget: float = 0.2,
+        burst: float = 10,
+        statuses: Optional[Iterable[int]] = None,
+        retry_mutations: bool = False,
+    ) -> None:
+        """Decides which failed requests are sent again and how long to wait before each attempt
+
+        Parameters
+        ----------
+        retries : int, optional
+            The maximum number of times to retry a request, by default 3
+        base : float, optional
+            The number of seconds the backoff starts from, doubling each attempt, by default 0.5
+        cap : float, optional
+            The maximum number of seconds to back off for, by default 30
+        budget : float, optional
+            The number of retries each request earns, bounding retries to a share of all requests, by default 0.2
+        burst : float, optional
+            The number of retries that can be made in a row before more have to be earned, by default 10
+        statuses : Optional[Iterable[int]], optional
+            The HTTP statuses to retry, by default 500, 502, 503, 504, 520, 521, 522, and 524
+        retry_mutations : bool, optional
+            Whether to retry mutations, which may have been applied even if the response was lost, by default False
+        """
+        self.retries: int = retries
+        self.base: float = base
+        self.cap: float = cap
+        self.budget: float = budget
+        self.burst: float = burst
+        self.statuses: Set[int] = (
+            {500, 502, 503, 504, 520, 521, 522, 524}
+            if statuses is None
+            else set(statuses)
+        )
+        self.retry_mutations: bool = retry_mutations
+        self.tokens: float = burst
+        self.lock: threading.Lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self.lock:
+            self.tokens = min(self.tokens + self.budget, self.burst)
+
+    def withdraw(self) -> bool:
+        with self.lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+    def retryable(self, error: BaseException) -> bool:
+        """Whether an error is transient and the request is worth retrying
+
+        Parameters
+        ----------
+        error : BaseException
+            The error the request failed with
+
+        Returns
+        -------
+        bool
+            Whether the error is retryable
+        """
+        if isinstance(error, errors.InvalidResponse):
+            # a 200 with an unreadable body is usually a truncated response
+            status = error.args[1] if len(error.args) > 1 else None
+            return status == 200 or status in self.statuses
+        return isinstance(error, self.EXCEPTIONS)
+
+    def should_retry(self, error: BaseException, attempt: int, mutation: bool) -> bool:
+        if mutation and not self.retry_mutations:
+            return False
+        if attempt >= self.retries or not self.retryable(error):
+            return False
+        return self.withdraw()
+
+    def backoff(self, attempt: int) -> float:
+        """Get the number of seconds to wait before a retry, using exponential backoff with full jitter
+
+        Parameters
+        ----------
+        attempt : int
+            The number of retries already made
+
+        Returns
+        -------
+        float
+            The number of seconds to wait
+        """
+        return random.uniform(0, min(self.cap, self.base * 2**attempt))
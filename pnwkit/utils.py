@@ -25,6 +25,8 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import datetime
+import json
+import re
 import sys
 import traceback
 from typing import TYPE_CHECKING
@@ -36,14 +38,23 @@ __all__ = (
     "get_datetime_or_none",
     "convert_data_array",
     "convert_data_dict",
+    "convert_data_item",
     "find_data_class",
     "find_event_data_class",
     "print_exception_with_header",
     "print_exception",
+    "find_json_array",
+    "decode_json_array",
+    "retrieve_exception",
 )
 
 if TYPE_CHECKING:
-    from typing import Any, Dict, List, Optional, Union
+    import asyncio
+    from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+    from .decoders import IncrementalDecoder
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
 
 
 def get_int_or_none(value: Optional[Any]) -> Optional[int]:
@@ -73,6 +84,12 @@ def convert_data_dict(data: Dict[Any, Any]) -> Union[Any, List[Any]]:
     return find_data_class(data["__typename"]).from_data(data)
 
 
+def convert_data_item(item: Any) -> Any:
+    if isinstance(item, dict):
+        return convert_data_dict(item)  # type: ignore
+    return item
+
+
 def find_data_class(name: str) -> Any:
     return getattr(data, name)
 
@@ -96,6 +113,66 @@ def print_exception(error: Exception) -> None:
     sys.stderr.flush()
 
 
+def skip_whitespace(text: str, index: int) -> int:
+    return WHITESPACE.match(text, index).end()  # type: ignore
+
+
+def find_json_array(
+    text: str, path: Sequence[str], decoder: IncrementalDecoder
+) -> Optional[int]:
+    """Find the opening bracket of the array at a path of object keys in a JSON document, only decoding the values before it in each object
+
+    Returns None if the document doesn't have an array at the path
+    """
+    index = skip_whitespace(text, 0)
+    for key in path:
+        if text[index : index + 1] != "{":
+            return None
+        index = skip_whitespace(text, index + 1)
+        while True:
+            if text[index : index + 1] != '"':
+                return None
+            name, index = decoder.raw_decode(text, index)
+            index = skip_whitespace(text, index)
+            if text[index : index + 1] != ":":
+                return None
+            index = skip_whitespace(text, index + 1)
+            if name == key:
+                break
+            _, index = decoder.raw_decode(text, index)
+            index = skip_whitespace(text, index)
+            if text[index : index + 1] != ",":
+                return None
+            index = skip_whitespace(text, index + 1)
+    return index if text[index : index + 1] == "[" else None
+
+
+def decode_json_array(
+    text: str,
+    index: int,
+    decoder: IncrementalDecoder,
+    convert: Callable[[Any], Any],
+) -> Tuple[List[Any], int]:
+    """Decode the array starting at ``index`` one item at a time, converting each item before the next is decoded
+
+    Returns the converted items and the index after the closing bracket
+    """
+    items: List[Any] = []
+    index = skip_whitespace(text, index + 1)
+    if text[index : index + 1] == "]":
+        return items, index + 1
+    while True:
+        item, index = decoder.raw_decode(text, index)
+        items.append(convert(item))
+        index = skip_whitespace(text, index)
+        char = text[index : index + 1]
+        if char == "]":
+            return items, index + 1
+        if char != ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, index)
+        index = skip_whitespace(text, index + 1)
+
+
 def remove_prefix(s: str, *prefixes: str) -> str:
     for prefix in prefixes:
         if s.startswith(prefix):
@@ -108,3 +185,10 @@ def remove_suffix(s: str, *suffixes: str) -> str:
         if s.endswith(suffix):
             return s[: -len(suffix)]
     return s
+
+
+def retrieve_exception(task: asyncio.Task[Any]) -> None:
+    # background tasks that are cancelled or abandoned with an error would
+    # otherwise log that the error was never retrieved
+    if not task.cancelled():
+        task.exception()
@@ -26,6 +26,9 @@ extras_require = {
         "sphinx==4.0.3",
         "pydata-sphinx-theme==0.6.3",
     ],
+    "speed": [
+        "orjson>=3.6.0",
+    ],
 }
 packages = ["pnwkit", "pnwkit.legacy", "pnwkit.ext.dumps", "pnwkit.ext.scrape"]
 